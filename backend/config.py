@@ -3,7 +3,9 @@ Configuration module for Movie Explorer Platform backend.
 Handles environment-specific settings and database configuration.
 """
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
+from sqlalchemy.pool import QueuePool, StaticPool
 
 # Load environment variables from .env file
 load_dotenv()
@@ -29,6 +31,13 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = DEBUG
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': QueuePool,
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_pre_ping': True,  # Verify connections before using
+        'pool_recycle': 3600,   # Recycle connections after 1 hour
+    }
     
     # CORS Configuration
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:5173').split(',')
@@ -36,6 +45,11 @@ class Config:
     # Pagination
     DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', '20'))
     MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', '100'))
+    STREAM_PAGE_SIZE = int(os.getenv('STREAM_PAGE_SIZE', '50'))  # Stream pages at least this big
+    
+    # Query Result Cache (disabled when REDIS_URL is unset)
+    REDIS_URL = os.getenv('REDIS_URL')
+    CACHE_TTL = int(os.getenv('CACHE_TTL', '60'))
     
     # API Configuration
     API_VERSION = 'v1'
@@ -58,6 +72,12 @@ class TestingConfig(Config):
     """Testing environment configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # A single shared connection keeps the in-memory database alive
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False},
+    }
+    REDIS_URL = None
 
 
 # Configuration dictionary
@@ -69,10 +89,14 @@ config = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_config():
     """
     Get configuration based on environment.
     
+    FLASK_ENV is read on the first call only; the environment is fixed
+    for the life of the process.
+    
     Returns:
         Config: Configuration object based on FLASK_ENV
     """
@@ -5,21 +5,16 @@ Handles SQLAlchemy engine creation, session factory, and base model class.
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
-from sqlalchemy.pool import QueuePool
 from config import get_config
 
 # Load configuration
 config = get_config()
 
-# Create SQLAlchemy engine with connection pooling
+# Create SQLAlchemy engine (pooling options come from the configuration)
 engine = create_engine(
     config.SQLALCHEMY_DATABASE_URI,
-    poolclass=QueuePool,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_recycle=3600,   # Recycle connections after 1 hour
-    echo=config.SQLALCHEMY_ECHO
+    echo=config.SQLALCHEMY_ECHO,
+    **config.SQLALCHEMY_ENGINE_OPTIONS
 )
 
 # Create session factory
@@ -85,16 +80,16 @@ def reset_db():
 
 
 # Event listener for SQLite foreign key support (if using SQLite for testing)
-# @event.listens_for(engine, "connect")
-# def set_sqlite_pragma(dbapi_connection, connection_record):
-#     """
-#     Enable foreign key support for SQLite connections.
-#     This is automatically called for each new connection.
-#     """
-#     if 'sqlite' in config.SQLALCHEMY_DATABASE_URI:
-#         cursor = dbapi_connection.cursor()
-#         cursor.execute("PRAGMA foreign_keys=ON")
-#         cursor.close()
+@event.listens_for(engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    """
+    Enable foreign key support for SQLite connections.
+    This is automatically called for each new connection.
+    """
+    if 'sqlite' in config.SQLALCHEMY_DATABASE_URI:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 
 
 # Context manager for database sessions
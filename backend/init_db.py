@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 """
 Database initialization script.
-Run this script to create database tables.
+Run this script to create database tables. On a database created by an
+older version, missing columns are added and backfilled instead.
 
 Usage:
     python init_db.py [--reset]
@@ -12,7 +13,8 @@ Options:
 import sys
 import argparse
 from database import init_db, reset_db, engine
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects.postgresql import JSONB
 
 
 def check_database_exists():
@@ -47,6 +49,44 @@ def check_tables_exist():
     return inspector.get_table_names()
 
 
+def upgrade_existing_tables():
+    """
+    Bring tables created by an older version up to date without losing data.
+    
+    Adds the denormalized movies.genre_names column if it is missing (or
+    converts it to JSONB on PostgreSQL), fills it for every movie that
+    has no value yet, and creates the list-query indexes that
+    create_all() skips on existing tables.
+    """
+    from models import Movie
+    from services import MovieService
+    
+    columns = {column['name']: column['type'] for column in inspect(engine).get_columns('movies')}
+    if 'genre_names' not in columns:
+        # Compile the type for this dialect (JSONB on PostgreSQL, JSON elsewhere)
+        column_type = Movie.__table__.c.genre_names.type.compile(dialect=engine.dialect)
+        with engine.begin() as connection:
+            connection.execute(
+                text(f'ALTER TABLE movies ADD COLUMN genre_names {column_type}')
+            )
+        print("✓ Added movies.genre_names column")
+    elif engine.dialect.name == 'postgresql' and not isinstance(columns['genre_names'], JSONB):
+        # Earlier versions created the column as json, which has no equality operator
+        with engine.begin() as connection:
+            connection.execute(text(
+                'ALTER TABLE movies ALTER COLUMN genre_names TYPE JSONB USING genre_names::jsonb'
+            ))
+        print("✓ Converted movies.genre_names to JSONB")
+    
+    backfilled = MovieService.backfill_genre_names()
+    print(f"✓ Backfilled genre names for {backfilled} movies")
+    
+    indexes = {index.name: index for index in Movie.__table__.indexes}
+    for name in ('ix_movies_year_id_desc', 'ix_movies_rating'):
+        indexes[name].create(engine, checkfirst=True)
+    print("✓ Created movie list indexes")
+
+
 def main():
     """Main function to initialize database."""
     parser = argparse.ArgumentParser(
@@ -73,6 +113,13 @@ def main():
     existing_tables = check_tables_exist()
     
     if existing_tables and not args.reset:
+        if 'movies' in existing_tables:
+            try:
+                upgrade_existing_tables()
+            except Exception as e:
+                print(f"\n✗ Error while upgrading existing tables: {e}")
+                sys.exit(1)
+        
         print(f"\n⚠ Warning: Database already has {len(existing_tables)} tables:")
         for table in existing_tables:
             print(f"  - {table}")
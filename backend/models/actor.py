@@ -32,7 +32,7 @@ class Actor(Base):
         'Movie',
         secondary=movie_actors,
         back_populates='actors',
-        lazy='dynamic'
+        lazy='select'
     )
     
     def __repr__(self):
@@ -67,13 +67,13 @@ class Actor(Base):
                 }
                 for movie in self.movies
             ]
-            data['movie_count'] = self.movies.count()
+            data['movie_count'] = len(self.movies)
             
             # Get unique genres this actor has worked in
             genres = set()
             for movie in self.movies:
                 for genre in movie.genres:
                     genres.add(genre.name)
-            data['genres'] = sorted(list(genres))
+            data['genres'] = sorted(genres)
         
         return data
\ No newline at end of file
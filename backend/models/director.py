@@ -30,7 +30,7 @@ class Director(Base):
     movies = relationship(
         'Movie',
         back_populates='director',
-        lazy='dynamic',
+        lazy='select',
         cascade='all, delete-orphan'
     )
     
@@ -66,6 +66,6 @@ class Director(Base):
                 }
                 for movie in self.movies
             ]
-            data['movie_count'] = self.movies.count()
+            data['movie_count'] = len(self.movies)
         
         return data
\ No newline at end of file
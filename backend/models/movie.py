@@ -1,8 +1,12 @@
 """
 Movie model for the core movie entity.
 """
-from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, CheckConstraint
-from sqlalchemy.orm import relationship
+from contextlib import nullcontext
+from sqlalchemy import (
+    Column, Integer, String, Text, Float, ForeignKey, CheckConstraint, Index, JSON, event
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, object_session
 from database import Base
 from models.associations import movie_actors, movie_genres
 
@@ -23,6 +27,7 @@ class Movie(Base):
         director: Relationship to Director
         actors: Relationship to Actors (many-to-many)
         genres: Relationship to Genres (many-to-many)
+        genre_names: Sorted genre names, denormalized from genres for list views
     """
     __tablename__ = 'movies'
     
@@ -31,8 +36,10 @@ class Movie(Base):
     description = Column(Text)
     release_year = Column(Integer, nullable=False, index=True)
     duration_minutes = Column(Integer)
-    rating = Column(Float, default=0.0)
+    rating = Column(Float, default=0.0, index=True)
     poster_url = Column(String(500))
+    # JSONB on PostgreSQL: plain json has no equality operator
+    genre_names = Column(JSON().with_variant(JSONB(), 'postgresql'), default=list)
     
     # Foreign Keys
     director_id = Column(
@@ -61,6 +68,13 @@ class Movie(Base):
         CheckConstraint('release_year >= 1888 AND release_year <= 2100', name='valid_year'),
         CheckConstraint('rating >= 0.0 AND rating <= 10.0', name='valid_rating'),
         CheckConstraint('duration_minutes > 0', name='valid_duration'),
+        # Covers the default list ordering so pages are read straight off the index
+        Index(
+            'ix_movies_year_id_desc',
+            release_year.desc(),
+            id.desc(),
+            postgresql_include=['title', 'rating', 'poster_url', 'director_id']
+        ),
     )
     
     def __repr__(self):
@@ -137,5 +151,36 @@ class Movie(Base):
                 'id': self.director.id,
                 'name': self.director.name
             } if self.director else None,
-            'genres': [genre.name for genre in self.genres]
-        }
\ No newline at end of file
+            'genres': self.genre_names or []
+        }
+
+
+def _sync_genre_names(movie, genre, add):
+    """
+    Add or remove a genre's name in movie.genre_names.
+
+    Runs with autoflush disabled: either object may be expired and need a
+    reload, and flushing mid-event would write the collection change
+    before it has been recorded.
+    """
+    session = object_session(movie) or object_session(genre)
+
+    with session.no_autoflush if session is not None else nullcontext():
+        names = set(movie.genre_names or ())
+        if add:
+            names.add(genre.name)
+        else:
+            names.discard(genre.name)
+        movie.genre_names = sorted(names)
+
+
+@event.listens_for(Movie.genres, 'append')
+def _add_genre_name(movie, genre, initiator):
+    """Keep Movie.genre_names in step when a genre is added through the ORM."""
+    _sync_genre_names(movie, genre, add=True)
+
+
+@event.listens_for(Movie.genres, 'remove')
+def _remove_genre_name(movie, genre, initiator):
+    """Keep Movie.genre_names in step when a genre is removed through the ORM."""
+    _sync_genre_names(movie, genre, add=False)
@@ -13,8 +13,10 @@ from utils.response import (
     not_found_response,
     created_response,
     validation_error_response,
-    paginated_response
+    paginated_response,
+    stream_paginated_response
 )
+from utils.cache import cached_query, invalidates
 from utils.validators import validate_page_number, validate_page_size
 from pydantic import ValidationError
 from config import get_config
@@ -24,6 +26,7 @@ config = get_config()
 
 
 @actors_bp.route('', methods=['GET'])
+@cached_query('actors', params=('page', 'page_size', 'include_movies'))
 def get_actors():
     """
     Get all actors with optional pagination.
@@ -37,6 +40,7 @@ def get_actors():
         200: List of actors
     """
     db = SessionLocal()
+    streaming = False
     try:
         # Pagination parameters
         page = int(request.args.get('page', 1))
@@ -50,19 +54,36 @@ def get_actors():
         if not validate_page_size(page_size, config.MAX_PAGE_SIZE):
             return error_response(f"Page size must be between 1 and {config.MAX_PAGE_SIZE}", 400)
 
+        serialize = (
+            ActorService.serialize_with_movies if include_movies
+            else ActorService.serialize_summary
+        )
+        stream = page_size >= config.STREAM_PAGE_SIZE
+
         # Delegate to service layer
-        actors, total_items = ActorService.get_actors_paginated(
+        actors, total_items = ActorService.get_paginated(
             db=db,
             page=page,
             page_size=page_size,
-            include_movies=include_movies
+            include_movies=include_movies,
+            stream=stream
         )
 
+        if stream:
+            # Large pages are serialized row by row; the session closes with the
+            # response, even when the body is never iterated (e.g. HEAD)
+            response = stream_paginated_response(
+                data=(serialize(actor) for actor in actors),
+                page=page,
+                page_size=page_size,
+                total_items=total_items
+            )
+            response.call_on_close(db.close)
+            streaming = True
+            return response
+
         # Serialize actors
-        if include_movies:
-            actor_list = [ActorService.serialize_actor_with_movies(actor) for actor in actors]
-        else:
-            actor_list = [ActorService.serialize_actor_summary(actor) for actor in actors]
+        actor_list = [serialize(actor) for actor in actors]
 
         return paginated_response(
             data=actor_list,
@@ -78,7 +99,8 @@ def get_actors():
         return error_response(f"Error retrieving actors: {str(e)}", 500)
 
     finally:
-        db.close()
+        if not streaming:
+            db.close()
 
 
 @actors_bp.route('/<int:actor_id>', methods=['GET'])
@@ -101,16 +123,16 @@ def get_actor(actor_id):
         include_movies = request.args.get('include_movies', 'false').lower() == 'true'
 
         # Delegate to service layer
-        actor = ActorService.get_actor_by_id(db, actor_id)
+        actor = ActorService.get_by_id(db, actor_id)
 
         if not actor:
             return not_found_response(f"Actor with ID {actor_id} not found")
 
         # Serialize actor
         if include_movies:
-            actor_data = ActorService.serialize_actor_with_movies(actor)
+            actor_data = ActorService.serialize_with_movies(actor)
         else:
-            actor_data = ActorService.serialize_actor_summary(actor)
+            actor_data = ActorService.serialize_summary(actor)
 
         return success_response(data=actor_data)
 
@@ -122,6 +144,7 @@ def get_actor(actor_id):
 
 
 @actors_bp.route('', methods=['POST'])
+@invalidates('actors', 'movies')
 def create_actor():
     """
     Create a new actor.
@@ -140,10 +163,10 @@ def create_actor():
         actor_schema = ActorCreate(**data)
 
         # Delegate to service layer
-        actor = ActorService.create_actor(db, actor_schema)
+        actor = ActorService.create(db, actor_schema)
 
         # Serialize response
-        actor_data = ActorService.serialize_actor_summary(actor)
+        actor_data = ActorService.serialize_summary(actor)
 
         return created_response(
             data=actor_data,
@@ -151,7 +174,7 @@ def create_actor():
         )
 
     except ValidationError as e:
-        return validation_error_response(e.errors())
+        return validation_error_response(e)
 
     except Exception as e:
         db.rollback()
@@ -162,6 +185,7 @@ def create_actor():
 
 
 @actors_bp.route('/<int:actor_id>', methods=['PUT'])
+@invalidates('actors', 'movies')
 def update_actor(actor_id):
     """
     Update an actor.
@@ -184,13 +208,13 @@ def update_actor(actor_id):
         actor_schema = ActorUpdate(**data)
 
         # Delegate to service layer
-        actor = ActorService.update_actor(db, actor_id, actor_schema)
+        actor = ActorService.update(db, actor_id, actor_schema)
 
         if not actor:
             return not_found_response(f"Actor with ID {actor_id} not found")
 
         # Serialize response
-        actor_data = ActorService.serialize_actor_summary(actor)
+        actor_data = ActorService.serialize_summary(actor)
 
         return success_response(
             data=actor_data,
@@ -198,7 +222,7 @@ def update_actor(actor_id):
         )
 
     except ValidationError as e:
-        return validation_error_response(e.errors())
+        return validation_error_response(e)
 
     except Exception as e:
         db.rollback()
@@ -209,6 +233,7 @@ def update_actor(actor_id):
 
 
 @actors_bp.route('/<int:actor_id>', methods=['DELETE'])
+@invalidates('actors', 'movies')
 def delete_actor(actor_id):
     """
     Delete an actor.
@@ -223,7 +248,7 @@ def delete_actor(actor_id):
     db = SessionLocal()
     try:
         # Delegate to service layer
-        deleted = ActorService.delete_actor(db, actor_id)
+        deleted = ActorService.delete(db, actor_id)
 
         if not deleted:
             return not_found_response(f"Actor with ID {actor_id} not found")
@@ -5,6 +5,7 @@ from flask import Blueprint, request
 from database import SessionLocal
 from models import Genre
 from schemas import GenreCreate, GenreUpdate, GenreResponse, GenreWithMovies
+from services import GenreService
 from utils.response import (
     success_response,
     error_response,
@@ -12,12 +13,14 @@ from utils.response import (
     created_response,
     validation_error_response
 )
+from utils.cache import cached_query, invalidates
 from pydantic import ValidationError
 
 genres_bp = Blueprint('genres', __name__)
 
 
 @genres_bp.route('', methods=['GET'])
+@cached_query('genres', params=('include_movies',))
 def get_genres():
     """
     Get all genres.
@@ -116,6 +119,7 @@ def get_genre(genre_id):
 
 
 @genres_bp.route('', methods=['POST'])
+@invalidates('genres', 'movies', 'actors', 'directors')
 def create_genre():
     """
     Create a new genre.
@@ -134,30 +138,19 @@ def create_genre():
         # Validate with Pydantic
         genre_schema = GenreCreate(**data)
         
-        # Check if genre with same name already exists
-        existing = db.query(Genre).filter(Genre.name == genre_schema.name).first()
-        if existing:
-            return error_response(f"Genre '{genre_schema.name}' already exists", 400)
-        
-        # Create new genre
-        genre = Genre(**genre_schema.model_dump())
-        db.add(genre)
-        db.commit()
-        db.refresh(genre)
-        
-        genre_data = {
-            'id': genre.id,
-            'name': genre.name,
-            'description': genre.description
-        }
+        # Delegate to service layer (raises ValueError on duplicate name)
+        genre = GenreService.create_genre(db, genre_schema)
         
         return created_response(
-            data=genre_data,
+            data=GenreService.serialize_genre(genre),
             message="Genre created successfully"
         )
     
     except ValidationError as e:
-        return validation_error_response(e.errors())
+        return validation_error_response(e)
+    
+    except ValueError as e:
+        return error_response(str(e), 400)
     
     except Exception as e:
         db.rollback()
@@ -168,6 +161,7 @@ def create_genre():
 
 
 @genres_bp.route('/<int:genre_id>', methods=['PUT'])
+@invalidates('genres', 'movies', 'actors', 'directors')
 def update_genre(genre_id):
     """
     Update a genre.
@@ -185,42 +179,25 @@ def update_genre(genre_id):
     """
     db = SessionLocal()
     try:
-        genre = db.query(Genre).filter(Genre.id == genre_id).first()
-        
-        if not genre:
-            return not_found_response(f"Genre with ID {genre_id} not found")
-        
         data = request.get_json()
         genre_schema = GenreUpdate(**data)
         
-        # Update only provided fields
-        update_data = genre_schema.model_dump(exclude_unset=True)
-        
-        # Check name uniqueness if updating name
-        if 'name' in update_data and update_data['name'] != genre.name:
-            existing = db.query(Genre).filter(Genre.name == update_data['name']).first()
-            if existing:
-                return error_response(f"Genre '{update_data['name']}' already exists", 400)
+        # Delegate to service layer (raises ValueError on duplicate name)
+        genre = GenreService.update_genre(db, genre_id, genre_schema)
         
-        for key, value in update_data.items():
-            setattr(genre, key, value)
-        
-        db.commit()
-        db.refresh(genre)
-        
-        genre_data = {
-            'id': genre.id,
-            'name': genre.name,
-            'description': genre.description
-        }
+        if not genre:
+            return not_found_response(f"Genre with ID {genre_id} not found")
         
         return success_response(
-            data=genre_data,
+            data=GenreService.serialize_genre(genre),
             message="Genre updated successfully"
         )
     
     except ValidationError as e:
-        return validation_error_response(e.errors())
+        return validation_error_response(e)
+    
+    except ValueError as e:
+        return error_response(str(e), 400)
     
     except Exception as e:
         db.rollback()
@@ -231,6 +208,7 @@ def update_genre(genre_id):
 
 
 @genres_bp.route('/<int:genre_id>', methods=['DELETE'])
+@invalidates('genres', 'movies', 'actors', 'directors')
 def delete_genre(genre_id):
     """
     Delete a genre.
@@ -244,14 +222,9 @@ def delete_genre(genre_id):
     """
     db = SessionLocal()
     try:
-        genre = db.query(Genre).filter(Genre.id == genre_id).first()
-        
-        if not genre:
+        if not GenreService.delete_genre(db, genre_id):
             return not_found_response(f"Genre with ID {genre_id} not found")
         
-        db.delete(genre)
-        db.commit()
-        
         return success_response(
             data={"id": genre_id},
             message="Genre deleted successfully"
@@ -13,8 +13,10 @@ from utils.response import (
     not_found_response,
     created_response,
     validation_error_response,
-    paginated_response
+    paginated_response,
+    cursor_paginated_response
 )
+from utils.cache import cached_query, invalidates
 from utils.validators import validate_page_number, validate_page_size, sanitize_search_query
 from pydantic import ValidationError
 from config import get_config
@@ -24,6 +26,10 @@ config = get_config()
 
 
 @movies_bp.route('', methods=['GET'])
+@cached_query('movies', params=(
+    'page', 'page_size', 'genre', 'director', 'actor', 'year', 'search',
+    'min_rating', 'max_rating', 'after_year', 'after_id'
+))
 def get_movies():
     """
     Get all movies with optional filtering and pagination.
@@ -38,6 +44,10 @@ def get_movies():
         search (str): Search in title and description
         min_rating (float): Minimum rating filter
         max_rating (float): Maximum rating filter
+        after_year (int): Keyset cursor - release_year of the previous page's last movie
+        after_id (int): Keyset cursor - id of the previous page's last movie
+            (with a cursor, page is ignored and meta carries next_cursor instead
+            of page numbers)
 
     Returns:
         200: List of movies
@@ -81,23 +91,51 @@ def get_movies():
             except ValueError:
                 return error_response("Invalid max_rating parameter", 400)
 
+        # Keyset cursor (both parts required)
+        after_year = request.args.get('after_year')
+        after_id = request.args.get('after_id')
+        use_cursor = after_year is not None or after_id is not None
+        if use_cursor:
+            try:
+                after_year = int(after_year)
+                after_id = int(after_id)
+            except (TypeError, ValueError):
+                return error_response("after_year and after_id must both be integers", 400)
+
         # Sanitize search query
         if search:
             search = sanitize_search_query(search)
 
-        # Delegate to service layer (returns serialized dicts)
+        # Delegate to service layer (returns serialized dicts); in cursor mode
+        # one extra movie is fetched to tell whether another page follows
         movie_list, total_items = MovieService.get_movies_with_filters(
             page=page,
-            page_size=page_size,
+            page_size=page_size + 1 if use_cursor else page_size,
             genre=genre,
             director=director,
             actor=actor,
             year=year,
             search=search,
             min_rating=min_rating,
-            max_rating=max_rating
+            max_rating=max_rating,
+            after_year=after_year,
+            after_id=after_id
         )
 
+        if use_cursor:
+            next_cursor = None
+            if len(movie_list) > page_size:
+                movie_list = movie_list[:page_size]
+                last = movie_list[-1]
+                next_cursor = {'after_year': last['release_year'], 'after_id': last['id']}
+
+            return cursor_paginated_response(
+                data=movie_list,
+                page_size=page_size,
+                total_items=total_items,
+                next_cursor=next_cursor
+            )
+
         return paginated_response(
             data=movie_list,
             page=page,
@@ -138,6 +176,7 @@ def get_movie(movie_id):
 
 
 @movies_bp.route('', methods=['POST'])
+@invalidates('movies', 'actors', 'directors', 'genres')
 def create_movie():
     """
     Create a new movie.
@@ -164,7 +203,7 @@ def create_movie():
         )
 
     except ValidationError as e:
-        return validation_error_response(e.errors())
+        return validation_error_response(e)
 
     except ValueError as e:
         # Service layer raises ValueError for business logic errors
@@ -175,6 +214,7 @@ def create_movie():
 
 
 @movies_bp.route('/<int:movie_id>', methods=['PUT'])
+@invalidates('movies', 'actors', 'directors', 'genres')
 def update_movie(movie_id):
     """
     Update a movie.
@@ -207,7 +247,7 @@ def update_movie(movie_id):
         )
 
     except ValidationError as e:
-        return validation_error_response(e.errors())
+        return validation_error_response(e)
 
     except ValueError as e:
         # Service layer raises ValueError for business logic errors
@@ -218,6 +258,7 @@ def update_movie(movie_id):
 
 
 @movies_bp.route('/<int:movie_id>', methods=['DELETE'])
+@invalidates('movies', 'actors', 'directors', 'genres')
 def delete_movie(movie_id):
     """
     Delete a movie.
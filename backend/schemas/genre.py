@@ -29,6 +29,14 @@ class GenreUpdate(BaseSchema):
     """Schema for updating a genre."""
     name: Optional[str] = Field(None, min_length=1, max_length=50)
     description: Optional[str] = Field(None, max_length=500)
+    
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: Optional[str]) -> str:
+        """Reject an explicit null or blank name; an omitted name is left unchanged."""
+        if v is None or not v.strip():
+            raise ValueError('Genre name cannot be empty')
+        return v.strip()
 
 
 class GenreResponse(GenreBase):
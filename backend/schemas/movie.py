@@ -4,7 +4,7 @@ Pydantic schemas for Movie model.
 from typing import Optional, List
 from pydantic import Field, field_validator
 from schemas.base import BaseSchema
-from utils.validators import validate_year, validate_rating
+from utils.validators import validate_year
 
 
 class MovieBase(BaseSchema):
@@ -34,10 +34,8 @@ class MovieBase(BaseSchema):
     
     @field_validator('rating')
     @classmethod
-    def validate_movie_rating(cls, v: float) -> float:
-        """Validate rating using custom validator."""
-        if not validate_rating(v):
-            raise ValueError('Rating must be between 0.0 and 10.0')
+    def round_movie_rating(cls, v: float) -> float:
+        """Round rating; the 0-10 range is enforced by the Field constraints."""
         return round(v, 1)  # Round to 1 decimal place
 
 
@@ -57,8 +55,14 @@ class MovieUpdate(BaseSchema):
     rating: Optional[float] = Field(None, ge=0.0, le=10.0)
     poster_url: Optional[str] = Field(None, max_length=500)
     director_id: Optional[int] = None
-    actor_ids: Optional[List[int]] = None
-    genre_ids: Optional[List[int]] = None
+    actor_ids: Optional[List[int]] = Field(
+        None,
+        description="Replaces the movie's actors; omit to keep them, null or [] to remove all"
+    )
+    genre_ids: Optional[List[int]] = Field(
+        None,
+        description="Replaces the movie's genres; omit to keep them, null or [] to remove all"
+    )
 
 
 class GenreSummary(BaseSchema):
@@ -3,12 +3,12 @@ Services package for business logic.
 Exports all service classes for easy import.
 """
 from services.movie_service import MovieService
-from services.actor_service import ActorService
-from services.director_service import DirectorService
+from services.person_service import PersonService, ActorService, DirectorService
 from services.genre_service import GenreService
 
 __all__ = [
     'MovieService',
+    'PersonService',
     'ActorService',
     'DirectorService',
     'GenreService'
@@ -3,9 +3,12 @@ Genre service layer for business logic.
 Handles all genre-related operations and data manipulation.
 """
 from typing import Optional, List, Dict, Tuple
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from models import Genre
+from models import Genre, movie_genres
 from schemas import GenreCreate, GenreUpdate
+from services.movie_service import MovieService
 
 
 class GenreService:
@@ -28,10 +31,17 @@ class GenreService:
         Returns:
             Tuple of (list of genres, total count)
         """
-        query = db.query(Genre)
-        total_items = query.count()
+        offset = (page - 1) * page_size
 
-        genres = query.offset((page - 1) * page_size).limit(page_size).all()
+        total_items = db.execute(
+            lambda_stmt(lambda: select(func.count()).select_from(Genre))
+        ).scalar_one()
+
+        genres = db.execute(
+            lambda_stmt(
+                lambda: select(Genre).order_by(Genre.id).offset(offset).limit(page_size)
+            )
+        ).scalars().all()
 
         return genres, total_items
 
@@ -60,7 +70,9 @@ class GenreService:
         Returns:
             Genre object or None if not found
         """
-        return db.query(Genre).filter(Genre.id == genre_id).first()
+        return db.execute(
+            lambda_stmt(lambda: select(Genre).where(Genre.id == genre_id))
+        ).scalar_one_or_none()
 
     @staticmethod
     def get_genre_by_name(db: Session, name: str) -> Optional[Genre]:
@@ -74,7 +86,9 @@ class GenreService:
         Returns:
             Genre object or None if not found
         """
-        return db.query(Genre).filter(Genre.name == name).first()
+        return db.execute(
+            lambda_stmt(lambda: select(Genre).where(Genre.name == name))
+        ).scalar_one_or_none()
 
     @staticmethod
     def create_genre(db: Session, genre_data: GenreCreate) -> Genre:
@@ -91,14 +105,18 @@ class GenreService:
         Raises:
             ValueError: If genre with same name already exists
         """
-        # Check if genre with same name exists
-        existing = GenreService.get_genre_by_name(db, genre_data.name)
-        if existing:
-            raise ValueError(f"Genre with name '{genre_data.name}' already exists")
-
         genre = Genre(**genre_data.model_dump())
         db.add(genre)
-        db.commit()
+
+        # Rely on the unique constraint on name rather than a racy pre-check
+        try:
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if GenreService._is_duplicate_name(e):
+                raise ValueError(f"Genre with name '{genre_data.name}' already exists")
+            raise
+
         db.refresh(genre)
 
         return genre
@@ -123,23 +141,27 @@ class GenreService:
         Raises:
             ValueError: If updated name conflicts with existing genre
         """
-        genre = db.query(Genre).filter(Genre.id == genre_id).first()
+        genre = GenreService.get_genre_by_id(db, genre_id)
 
         if not genre:
             return None
 
-        # Check if new name conflicts with existing genre
-        update_dict = genre_data.model_dump(exclude_unset=True)
-        if 'name' in update_dict:
-            existing = GenreService.get_genre_by_name(db, update_dict['name'])
-            if existing and existing.id != genre_id:
-                raise ValueError(f"Genre with name '{update_dict['name']}' already exists")
-
         # Update fields
-        for key, value in update_dict.items():
-            setattr(genre, key, value)
+        for key in genre_data.model_fields_set:
+            setattr(genre, key, getattr(genre_data, key))
+
+        # A name conflict with another genre violates the unique constraint
+        try:
+            if 'name' in genre_data.model_fields_set:
+                db.flush()
+                MovieService.refresh_genre_names(db, GenreService._movie_ids(db, genre_id))
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if GenreService._is_duplicate_name(e):
+                raise ValueError(f"Genre with name '{genre_data.name}' already exists")
+            raise
 
-        db.commit()
         db.refresh(genre)
 
         return genre
@@ -156,16 +178,51 @@ class GenreService:
         Returns:
             True if deleted, False if not found
         """
-        genre = db.query(Genre).filter(Genre.id == genre_id).first()
+        genre = GenreService.get_genre_by_id(db, genre_id)
 
         if not genre:
             return False
 
+        movie_ids = GenreService._movie_ids(db, genre_id)
+
         db.delete(genre)
+        db.flush()
+        MovieService.refresh_genre_names(db, movie_ids)
         db.commit()
 
         return True
 
+    @staticmethod
+    def _is_duplicate_name(error: IntegrityError) -> bool:
+        """
+        Tell whether an IntegrityError comes from the unique genre name.
+
+        Args:
+            error: Error raised while flushing a genre
+
+        Returns:
+            True for a unique violation on genres.name, False otherwise
+        """
+        message = str(error.orig)
+        # SQLite names the column; PostgreSQL names the unique index
+        return 'UNIQUE constraint failed: genres.name' in message or 'ix_genres_name' in message
+
+    @staticmethod
+    def _movie_ids(db: Session, genre_id: int) -> List[int]:
+        """
+        Get the IDs of movies tagged with a genre.
+
+        Args:
+            db: Database session
+            genre_id: Genre ID
+
+        Returns:
+            List of movie IDs
+        """
+        return db.execute(
+            select(movie_genres.c.movie_id).where(movie_genres.c.genre_id == genre_id)
+        ).scalars().all()
+
     @staticmethod
     def serialize_genre(genre: Genre, include_movie_count: bool = False) -> Dict:
         """
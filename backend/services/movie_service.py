@@ -3,10 +3,11 @@ Movie service layer for business logic.
 Handles all movie-related operations and data manipulation.
 Database sessions are managed by the service layer.
 """
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Iterable
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from models import Movie, Actor, Director, Genre
+from sqlalchemy import or_, and_, func, lambda_stmt, select, update, Table
+from sqlalchemy.exc import IntegrityError
+from models import Movie, Actor, Director, Genre, movie_actors, movie_genres
 from schemas import MovieCreate, MovieUpdate
 from services.base_service import BaseService
 
@@ -25,11 +26,17 @@ class MovieService(BaseService):
         search: Optional[str] = None,
         min_rating: Optional[float] = None,
         max_rating: Optional[float] = None,
+        after_year: Optional[int] = None,
+        after_id: Optional[int] = None,
         db: Optional[Session] = None
     ) -> Tuple[List[Dict], int]:
         """
         Get movies with optional filters and pagination.
 
+        Movies are ordered newest first (release_year, then id, descending).
+        Passing after_year/after_id from the last movie of the previous page
+        seeks directly to the next page instead of using OFFSET.
+
         Args:
             page: Page number (1-indexed)
             page_size: Number of items per page
@@ -40,6 +47,8 @@ class MovieService(BaseService):
             search: Search in title and description
             min_rating: Minimum rating filter
             max_rating: Maximum rating filter
+            after_year: Keyset cursor - release year of the previous page's last movie
+            after_id: Keyset cursor - ID of the previous page's last movie
             db: Optional database session (if None, creates one)
 
         Returns:
@@ -48,41 +57,35 @@ class MovieService(BaseService):
         session, should_close = MovieService._get_session(db)
 
         try:
-            # Base query
-            query = session.query(Movie)
-
-            # Apply filters
-            if genre:
-                query = query.join(Movie.genres).filter(Genre.name.ilike(f"%{genre}%"))
-
-            if director:
-                query = query.join(Movie.director).filter(Director.name.ilike(f"%{director}%"))
-
-            if actor:
-                query = query.join(Movie.actors).filter(Actor.name.ilike(f"%{actor}%"))
-
-            if year:
-                query = query.filter(Movie.release_year == year)
+            # Count and page statements share the same cached filter criteria
+            count_stmt = MovieService._apply_filters(
+                lambda_stmt(lambda: select(func.count(Movie.id))),
+                genre, director, actor, year, search, min_rating, max_rating
+            )
+            page_stmt = MovieService._apply_filters(
+                lambda_stmt(lambda: select(Movie)),
+                genre, director, actor, year, search, min_rating, max_rating
+            )
 
-            if min_rating is not None:
-                query = query.filter(Movie.rating >= min_rating)
+            # Get total count (before pagination)
+            total_items = session.execute(count_stmt).scalar_one()
 
-            if max_rating is not None:
-                query = query.filter(Movie.rating <= max_rating)
+            # Apply a stable ordering matching ix_movies_year_id_desc
+            page_stmt += lambda s: s.order_by(Movie.release_year.desc(), Movie.id.desc())
 
-            if search:
-                query = query.filter(
+            # Apply pagination (seek past the cursor when given, else offset)
+            if after_year is not None and after_id is not None:
+                page_stmt += lambda s: s.where(
                     or_(
-                        Movie.title.ilike(f"%{search}%"),
-                        Movie.description.ilike(f"%{search}%")
+                        Movie.release_year < after_year,
+                        and_(Movie.release_year == after_year, Movie.id < after_id)
                     )
-                )
-
-            # Get total count (before pagination)
-            total_items = query.distinct().count()
+                ).limit(page_size)
+            else:
+                offset = (page - 1) * page_size
+                page_stmt += lambda s: s.offset(offset).limit(page_size)
 
-            # Apply pagination
-            movies = query.distinct().offset((page - 1) * page_size).limit(page_size).all()
+            movies = session.execute(page_stmt).scalars().all()
 
             # Serialize BEFORE closing session (important!)
             movie_dicts = [MovieService.serialize_movie_summary(movie) for movie in movies]
@@ -93,6 +96,67 @@ class MovieService(BaseService):
             if should_close:
                 session.close()
 
+    @staticmethod
+    def _apply_filters(
+        stmt,
+        genre: Optional[str] = None,
+        director: Optional[str] = None,
+        actor: Optional[str] = None,
+        year: Optional[int] = None,
+        search: Optional[str] = None,
+        min_rating: Optional[float] = None,
+        max_rating: Optional[float] = None
+    ):
+        """
+        Append movie filter criteria to a lambda statement.
+
+        Each optional filter is its own lambda, so every filter combination
+        compiles to SQL once and is reused from the statement cache. Genre
+        and actor filters are EXISTS subqueries rather than joins, so each
+        movie appears at most once and no DISTINCT is needed.
+
+        Args:
+            stmt: StatementLambdaElement selecting from Movie
+            genre, director, actor, year, search, min_rating, max_rating:
+                Filters as accepted by get_movies_with_filters
+
+        Returns:
+            The statement with filter criteria appended
+        """
+        if genre:
+            genre_pattern = f"%{genre}%"
+            stmt += lambda s: s.where(Movie.genres.any(Genre.name.ilike(genre_pattern)))
+
+        if director:
+            director_pattern = f"%{director}%"
+            stmt += lambda s: s.join(Movie.director).where(
+                Director.name.ilike(director_pattern)
+            )
+
+        if actor:
+            actor_pattern = f"%{actor}%"
+            stmt += lambda s: s.where(Movie.actors.any(Actor.name.ilike(actor_pattern)))
+
+        if year:
+            stmt += lambda s: s.where(Movie.release_year == year)
+
+        if min_rating is not None:
+            stmt += lambda s: s.where(Movie.rating >= min_rating)
+
+        if max_rating is not None:
+            stmt += lambda s: s.where(Movie.rating <= max_rating)
+
+        if search:
+            search_pattern = f"%{search}%"
+            stmt += lambda s: s.where(
+                or_(
+                    Movie.title.ilike(search_pattern),
+                    Movie.description.ilike(search_pattern)
+                )
+            )
+
+        return stmt
+
     @staticmethod
     def get_movie_by_id(movie_id: int, db: Optional[Session] = None) -> Optional[Dict]:
         """
@@ -108,7 +172,9 @@ class MovieService(BaseService):
         session, should_close = MovieService._get_session(db)
 
         try:
-            movie = session.query(Movie).filter(Movie.id == movie_id).first()
+            movie = session.execute(
+                lambda_stmt(lambda: select(Movie).where(Movie.id == movie_id))
+            ).scalar_one_or_none()
 
             if not movie:
                 return None
@@ -216,39 +282,35 @@ class MovieService(BaseService):
             if not movie:
                 return None
 
-            # Extract relationship IDs
-            update_dict = movie_data.model_dump(
-                exclude_unset=True,
-                exclude={'actor_ids', 'genre_ids'}
-            )
+            fields_set = movie_data.model_fields_set
 
             # Validate director if updating
-            if 'director_id' in update_dict and update_dict['director_id']:
+            if 'director_id' in fields_set and movie_data.director_id:
                 director = session.query(Director).filter(
-                    Director.id == update_dict['director_id']
+                    Director.id == movie_data.director_id
                 ).first()
                 if not director:
-                    raise ValueError(f"Director with ID {update_dict['director_id']} not found")
+                    raise ValueError(f"Director with ID {movie_data.director_id} not found")
 
-            # Update basic fields
-            for key, value in update_dict.items():
-                setattr(movie, key, value)
+            # Update basic fields (relationship IDs are handled below)
+            for key in fields_set - {'actor_ids', 'genre_ids'}:
+                setattr(movie, key, getattr(movie_data, key))
 
-            # Update actors if provided
-            if movie_data.actor_ids is not None:
-                actors = session.query(Actor).filter(Actor.id.in_(movie_data.actor_ids)).all()
-                if len(actors) != len(movie_data.actor_ids):
-                    raise ValueError("One or more actor IDs not found")
-                movie.actors.clear()
-                movie.actors.extend(actors)
+            # Replace actors if provided
+            if 'actor_ids' in fields_set:
+                MovieService._replace_links(
+                    session, movie_actors, 'actor_id', movie_id, movie_data.actor_ids,
+                    "One or more actor IDs not found"
+                )
 
-            # Update genres if provided
-            if movie_data.genre_ids is not None:
-                genres = session.query(Genre).filter(Genre.id.in_(movie_data.genre_ids)).all()
-                if len(genres) != len(movie_data.genre_ids):
-                    raise ValueError("One or more genre IDs not found")
-                movie.genres.clear()
-                movie.genres.extend(genres)
+            # Replace genres if provided
+            if 'genre_ids' in fields_set:
+                MovieService._replace_links(
+                    session, movie_genres, 'genre_id', movie_id, movie_data.genre_ids,
+                    "One or more genre IDs not found"
+                )
+                # The Core rewrite bypasses the ORM events that maintain genre_names
+                movie.genre_names = MovieService._load_genre_names(session, [movie_id])[movie_id]
 
             if should_close:
                 session.commit()
@@ -267,6 +329,129 @@ class MovieService(BaseService):
             if should_close:
                 session.close()
 
+    @staticmethod
+    def _replace_links(
+        session: Session,
+        table: Table,
+        column: str,
+        movie_id: int,
+        ids: List[int],
+        error_message: str
+    ) -> None:
+        """
+        Replace a movie's rows in an association table.
+
+        Uses one DELETE and one multi-row INSERT instead of per-row ORM
+        collection events. Unknown IDs are rejected by the foreign key.
+
+        Args:
+            session: Database session
+            table: Association table (movie_actors or movie_genres)
+            column: Name of the non-movie foreign key column
+            movie_id: Movie ID
+            ids: New related IDs (duplicates are ignored)
+            error_message: Message for the ValueError raised on unknown IDs
+
+        Raises:
+            ValueError: If any ID does not reference an existing row
+        """
+        session.execute(table.delete().where(table.c.movie_id == movie_id))
+
+        if not ids:
+            return
+
+        try:
+            session.execute(
+                table.insert(),
+                [{'movie_id': movie_id, column: related_id} for related_id in dict.fromkeys(ids)]
+            )
+        except IntegrityError:
+            raise ValueError(error_message)
+
+    @staticmethod
+    def _load_genre_names(session: Session, movie_ids: Iterable[int]) -> Dict[int, List[str]]:
+        """
+        Read the sorted genre names of movies from the association table.
+
+        Args:
+            session: Database session
+            movie_ids: Movie IDs
+
+        Returns:
+            Dictionary mapping each movie ID to its genre names
+        """
+        names = {movie_id: [] for movie_id in movie_ids}
+        if not names:
+            return names
+
+        rows = session.execute(
+            select(movie_genres.c.movie_id, Genre.name)
+            .join(Genre, Genre.id == movie_genres.c.genre_id)
+            .where(movie_genres.c.movie_id.in_(list(names)))
+            .order_by(Genre.name)
+        )
+        for movie_id, name in rows:
+            names[movie_id].append(name)
+
+        return names
+
+    @staticmethod
+    def refresh_genre_names(session: Session, movie_ids: Iterable[int]) -> None:
+        """
+        Recompute the denormalized genre_names column for the given movies.
+
+        Needed after genre changes the ORM collection events don't see,
+        such as a genre rename or delete.
+
+        Args:
+            session: Database session
+            movie_ids: Movie IDs to refresh
+        """
+        names = MovieService._load_genre_names(session, movie_ids)
+        if names:
+            session.execute(
+                update(Movie),
+                [{'id': movie_id, 'genre_names': value} for movie_id, value in names.items()]
+            )
+
+    @staticmethod
+    def backfill_genre_names(db: Optional[Session] = None, batch_size: int = 500) -> int:
+        """
+        Fill genre_names for movies that predate the column.
+
+        Movies whose genre_names is NULL are refreshed from the association
+        table in batches; movies that already have a value are left alone.
+
+        Args:
+            db: Optional database session (if None, creates one)
+            batch_size: Number of movies refreshed per UPDATE
+
+        Returns:
+            Number of movies backfilled
+        """
+        session, should_close = MovieService._get_session(db)
+
+        try:
+            movie_ids = session.execute(
+                select(Movie.id).where(Movie.genre_names.is_(None)).order_by(Movie.id)
+            ).scalars().all()
+
+            for start in range(0, len(movie_ids), batch_size):
+                MovieService.refresh_genre_names(session, movie_ids[start:start + batch_size])
+
+            if should_close:
+                session.commit()
+
+            return len(movie_ids)
+
+        except Exception:
+            if should_close:
+                session.rollback()
+            raise
+        finally:
+            if should_close:
+                session.close()
+
     @staticmethod
     def delete_movie(movie_id: int, db: Optional[Session] = None) -> bool:
         """
@@ -324,7 +509,7 @@ class MovieService(BaseService):
                 'id': movie.director.id,
                 'name': movie.director.name
             } if movie.director else None,
-            'genres': [genre.name for genre in movie.genres]
+            'genres': movie.genre_names or []
         }
 
     @staticmethod
@@ -0,0 +1,216 @@
+"""
+Person service layer for business logic.
+Handles operations shared by people credited on movies (actors and directors).
+"""
+from typing import Optional, Dict, Tuple, Iterable, Generic, TypeVar, Type, Union
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.orm import Session, selectinload
+from models import Actor, Director
+from schemas import ActorCreate, ActorUpdate, DirectorCreate, DirectorUpdate
+
+T = TypeVar('T', Actor, Director)
+
+
+class PersonService(Generic[T]):
+    """
+    Service class for person-related business logic.
+
+    One instance exists per person model, e.g.
+    ``ActorService = PersonService(Actor)``.
+    """
+
+    def __init__(self, model: Type[T]):
+        """
+        Initialize the service for a person model.
+
+        Args:
+            model: Person model class (Actor or Director)
+        """
+        self.model = model
+
+    def get_paginated(
+        self,
+        db: Session,
+        page: int = 1,
+        page_size: int = 20,
+        include_movies: bool = False,
+        stream: bool = False
+    ) -> Tuple[Iterable[T], int]:
+        """
+        Get paginated list of people.
+
+        Args:
+            db: Database session
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+            include_movies: Whether to include movie relationships
+            stream: Return a lazily-fetched iterator instead of a list
+
+        Returns:
+            Tuple of (list or iterator of people, total count)
+        """
+        model = self.model
+        offset = (page - 1) * page_size
+
+        total_items = db.execute(
+            lambda_stmt(lambda: select(func.count()).select_from(model))
+        ).scalar_one()
+
+        stmt = lambda_stmt(
+            lambda: select(model).order_by(model.id).offset(offset).limit(page_size)
+        )
+
+        if include_movies:
+            # Load every person's movies in one extra query instead of one per person
+            stmt += lambda s: s.options(selectinload(model.movies))
+
+        if stream:
+            # Fetch rows in batches as the caller iterates
+            return db.execute(stmt, execution_options={'yield_per': 200}).scalars(), total_items
+
+        people = db.execute(stmt).scalars().all()
+
+        return people, total_items
+
+    def get_by_id(self, db: Session, person_id: int) -> Optional[T]:
+        """
+        Get a single person by ID.
+
+        Args:
+            db: Database session
+            person_id: Person ID
+
+        Returns:
+            Person object or None if not found
+        """
+        model = self.model
+        return db.execute(
+            lambda_stmt(lambda: select(model).where(model.id == person_id))
+        ).scalar_one_or_none()
+
+    def create(self, db: Session, person_data: Union[ActorCreate, DirectorCreate]) -> T:
+        """
+        Create a new person.
+
+        Args:
+            db: Database session
+            person_data: Validated person creation data
+
+        Returns:
+            Created person object
+        """
+        person = self.model(**person_data.model_dump())
+        db.add(person)
+        db.commit()
+        db.refresh(person)
+
+        return person
+
+    def update(
+        self,
+        db: Session,
+        person_id: int,
+        person_data: Union[ActorUpdate, DirectorUpdate]
+    ) -> Optional[T]:
+        """
+        Update an existing person.
+
+        Args:
+            db: Database session
+            person_id: Person ID to update
+            person_data: Validated person update data
+
+        Returns:
+            Updated person object or None if not found
+        """
+        person = self.get_by_id(db, person_id)
+
+        if not person:
+            return None
+
+        # Update only provided fields
+        for key in person_data.model_fields_set:
+            setattr(person, key, getattr(person_data, key))
+
+        db.commit()
+        db.refresh(person)
+
+        return person
+
+    def delete(self, db: Session, person_id: int) -> bool:
+        """
+        Delete a person by ID.
+
+        Args:
+            db: Database session
+            person_id: Person ID to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        person = self.get_by_id(db, person_id)
+
+        if not person:
+            return False
+
+        db.delete(person)
+        db.commit()
+
+        return True
+
+    @staticmethod
+    def serialize_summary(person: T) -> Dict:
+        """
+        Serialize person to summary format for list views.
+
+        Args:
+            person: Person object
+
+        Returns:
+            Dictionary with summarized person data
+        """
+        return {
+            'id': person.id,
+            'name': person.name,
+            'bio': person.bio,
+            'birth_date': person.birth_date.isoformat() if person.birth_date else None,
+            'nationality': person.nationality
+        }
+
+    @staticmethod
+    def serialize_with_movies(person: T) -> Dict:
+        """
+        Serialize person with full movie details.
+
+        Genre names come from each movie's denormalized genre_names, so no
+        query is issued per movie or per person once movies are loaded.
+
+        Args:
+            person: Person object
+
+        Returns:
+            Dictionary with person data including filmography
+        """
+        movies = person.movies
+        data = PersonService.serialize_summary(person)
+        data.update({
+            'movies': [
+                {
+                    'id': movie.id,
+                    'title': movie.title,
+                    'release_year': movie.release_year,
+                    'rating': movie.rating,
+                    'poster_url': movie.poster_url,
+                    'genres': movie.genre_names or []
+                }
+                for movie in movies
+            ],
+            'movie_count': len(movies),
+            'genres': sorted({name for movie in movies for name in movie.genre_names or ()})
+        })
+
+        return data
+
+
+ActorService = PersonService(Actor)
+DirectorService = PersonService(Director)
@@ -7,7 +7,7 @@ Usage:
     python test_db_connection.py
 """
 from sqlalchemy import text
-from database import engine, SessionLocal
+from database import engine
 from config import get_config
 
 
@@ -25,24 +25,15 @@ def test_connection():
     print()
     
     try:
-        # Test engine connection
+        # Test connection with a single round-trip
         with engine.connect() as connection:
-            result = connection.execute(text("SELECT version();"))
-            version = result.fetchone()[0]
+            version, db_name = connection.execute(
+                text("SELECT version(), current_database();")
+            ).fetchone()
             print("✓ Engine connection successful")
             print(f"PostgreSQL version: {version}")
-            print()
-        
-        # Test session
-        db = SessionLocal()
-        try:
-            result = db.execute(text("SELECT current_database();"))
-            db_name = result.fetchone()[0]
-            print("✓ Session connection successful")
             print(f"Connected to database: {db_name}")
             print()
-        finally:
-            db.close()
         
         # Test connection pool
         print(f"✓ Connection pool configured")
@@ -1,17 +1,34 @@
 """
 Pytest configuration and fixtures for backend tests.
 """
+import os
+import sqlite3
+from contextlib import closing
 import pytest
 from datetime import date
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from database import Base
-from models import Movie, Actor, Director, Genre
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+# Build the app's engine from TestingConfig (in-memory SQLite)
+os.environ['FLASK_ENV'] = 'testing'
+
+from database import Base, SessionLocal, engine
+from models import Movie, Actor, Director, Genre, movie_actors, movie_genres
 from app import create_app
 
 
+# Schema DDL compiled once at import; the template is built from this script
+_SCHEMA_SQL = ';\n'.join(
+    str(ddl.compile(dialect=sqlite.dialect())).strip()
+    for table in Base.metadata.sorted_tables
+    for ddl in [CreateTable(table), *(CreateIndex(index) for index in table.indexes)]
+) + ';'
+
+
 @pytest.fixture(scope='session')
-def app():
+def app(_engine):
     """Create application for testing."""
     from config import TestingConfig
     app = create_app(TestingConfig)
@@ -19,23 +36,156 @@ def app():
 
 
 @pytest.fixture(scope='session')
-def client(app):
-    """Create test client."""
-    return app.test_client()
+def _sqlite_template(tmp_path_factory):
+    """
+    Build the schema once into a template SQLite file.
+
+    Under pytest-xdist every worker process runs its own session fixtures,
+    so each one builds a separately named template and in-memory database.
+    """
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+    path = tmp_path_factory.mktemp('db') / f'template-{worker_id}.sqlite'
+    with closing(sqlite3.connect(path)) as template:
+        template.executescript(_SCHEMA_SQL)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def _engine(_sqlite_template):
+    """
+    Prepare the app's in-memory database engine for testing.
+
+    TestingConfig gives the engine a single StaticPool connection; its
+    schema is restored from the template when that connection opens.
+    """
+    @event.listens_for(engine, 'connect')
+    def _prepare_connection(dbapi_connection, connection_record):
+        # Copy the prebuilt schema pages instead of running DDL
+        with closing(sqlite3.connect(_sqlite_template)) as template:
+            template.backup(dbapi_connection)
+
+        # pysqlite manages transactions itself and breaks SAVEPOINT; let
+        # SQLAlchemy emit BEGIN so each test can be rolled back cleanly
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(connection):
+        connection.exec_driver_sql('BEGIN')
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope='module')
+def populated_db(_engine):
+    """
+    Populate a known dataset once per module for read-only route tests.
+
+    Contains 2 directors, 3 actors, 2 genres and 3 movies. The rows are
+    committed, so tests using this fixture must not modify them; they are
+    deleted when the module finishes.
+    """
+    with Session(_engine) as session:
+        # Bulk inserts with explicit ids skip ORM unit-of-work bookkeeping
+        session.bulk_insert_mappings(Director, [
+            {'id': 1, 'name': "Populated Director One", 'nationality': "British"},
+            {'id': 2, 'name': "Populated Director Two", 'nationality': "American"},
+        ])
+        session.bulk_insert_mappings(Actor, [
+            {'id': i, 'name': f"Populated Actor {i}"} for i in range(1, 4)
+        ])
+        session.bulk_insert_mappings(Genre, [
+            {'id': 1, 'name': "Thriller", 'description': "Thriller movies"},
+            {'id': 2, 'name': "Comedy", 'description': "Comedy movies"},
+        ])
+        session.bulk_insert_mappings(Movie, [
+            {
+                'id': 1, 'title': "Populated Movie 1", 'release_year': 2010, 'rating': 8.0,
+                'director_id': 1, 'genre_names': ["Thriller"]
+            },
+            {
+                'id': 2, 'title': "Populated Movie 2", 'release_year': 2015, 'rating': 7.0,
+                'director_id': 1, 'genre_names': ["Comedy", "Thriller"]
+            },
+            {
+                'id': 3, 'title': "Populated Movie 3", 'release_year': 2020, 'rating': 6.0,
+                'director_id': 2, 'genre_names': ["Comedy"]
+            },
+        ])
+        session.execute(movie_actors.insert(), [
+            {'movie_id': movie_id, 'actor_id': actor_id}
+            for movie_id, actor_id in [(1, 1), (1, 2), (2, 2), (2, 3), (3, 3)]
+        ])
+        session.execute(movie_genres.insert(), [
+            {'movie_id': movie_id, 'genre_id': genre_id}
+            for movie_id, genre_id in [(1, 1), (2, 1), (2, 2), (3, 2)]
+        ])
+        session.commit()
+    
+    yield
+    
+    with _engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
 
 
 @pytest.fixture(scope='function')
-def db_session():
-    """Create a test database session."""
-    engine = create_engine('sqlite:///:memory:')
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+def db_session(_engine):
+    """
+    Create a test database session rolled back after each test.
+
+    The session joins an outer transaction through a SAVEPOINT, so
+    commit() and rollback() inside tests never reach the shared schema.
+    Objects are not expired on commit, so fixtures can hand them out
+    without a refresh() round-trip.
+    """
+    connection = _engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode='create_savepoint',
+        expire_on_commit=False
+    )
     
     yield session
     
     session.close()
-    Base.metadata.drop_all(engine)
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope='function')
+def transactional_db(db_session):
+    """
+    Run the app's request sessions inside the test's transaction.
+
+    SessionLocal is rebound to the db_session connection, so data written
+    through the API is visible to the test and rolled back with it.
+    """
+    SessionLocal.remove()
+    SessionLocal.configure(
+        bind=db_session.bind,
+        join_transaction_mode='create_savepoint'
+    )
+
+    yield db_session
+
+    SessionLocal.remove()
+    SessionLocal.configure(bind=engine, join_transaction_mode='conservative_savepoint')
+
+
+@pytest.fixture(scope='session')
+def client(app):
+    """Create test client shared by the whole test session."""
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def _tx(request):
+    """Run every test that uses the client inside its own rolled-back transaction."""
+    if 'client' in request.fixturenames:
+        request.getfixturevalue('transactional_db')
 
 
 @pytest.fixture
@@ -49,7 +199,6 @@ def sample_director(db_session):
     )
     db_session.add(director)
     db_session.commit()
-    db_session.refresh(director)
     return director
 
 
@@ -64,7 +213,6 @@ def sample_actor(db_session):
     )
     db_session.add(actor)
     db_session.commit()
-    db_session.refresh(actor)
     return actor
 
 
@@ -77,7 +225,6 @@ def sample_genre(db_session):
     )
     db_session.add(genre)
     db_session.commit()
-    db_session.refresh(genre)
     return genre
 
 
@@ -90,58 +237,54 @@ def sample_movie(db_session, sample_director, sample_actor, sample_genre):
         release_year=2020,
         duration_minutes=120,
         rating=7.5,
-        director_id=sample_director.id
+        director_id=sample_director.id,
+        actors=[sample_actor],
+        genres=[sample_genre]
     )
-    movie.actors.append(sample_actor)
-    movie.genres.append(sample_genre)
     
     db_session.add(movie)
     db_session.commit()
-    db_session.refresh(movie)
     return movie
 
 
 @pytest.fixture
 def multiple_movies(db_session, sample_director):
     """Create multiple movies for testing pagination and filtering."""
-    movies = []
-    
-    # Create genres
+    # Create genres and actors
     scifi = Genre(name="Sci-Fi", description="Science Fiction")
     drama = Genre(name="Drama", description="Drama movies")
-    db_session.add_all([scifi, drama])
-    db_session.commit()
-    
-    # Create actors
     actor1 = Actor(name="Actor One")
     actor2 = Actor(name="Actor Two")
-    db_session.add_all([actor1, actor2])
-    db_session.commit()
+    
+    # Alternate genres; the first three movies share an actor
+    genres = [scifi if i % 2 == 0 else drama for i in range(5)]
+    actors = [actor1 if i < 3 else actor2 for i in range(5)]
     
     # Create movies
-    for i in range(5):
-        movie = Movie(
+    movies = [
+        Movie(
             title=f"Movie {i+1}",
             description=f"Description {i+1}",
             release_year=2020 + i,
             rating=7.0 + (i * 0.5),
-            director_id=sample_director.id
+            director_id=sample_director.id,
+            genre_names=[genres[i].name]
         )
-        
-        # Add genres
-        if i % 2 == 0:
-            movie.genres.append(scifi)
-        else:
-            movie.genres.append(drama)
-        
-        # Add actors
-        if i < 3:
-            movie.actors.append(actor1)
-        else:
-            movie.actors.append(actor2)
-        
-        db_session.add(movie)
-        movies.append(movie)
+        for i in range(5)
+    ]
+    
+    db_session.add_all([scifi, drama, actor1, actor2, *movies])
+    db_session.flush()
+    
+    # Link with plain multi-row inserts instead of ORM collection appends
+    db_session.execute(
+        movie_genres.insert(),
+        [{'movie_id': movie.id, 'genre_id': genre.id} for movie, genre in zip(movies, genres)]
+    )
+    db_session.execute(
+        movie_actors.insert(),
+        [{'movie_id': movie.id, 'actor_id': actor.id} for movie, actor in zip(movies, actors)]
+    )
     
     db_session.commit()
-    return movies
\ No newline at end of file
+    return movies
@@ -0,0 +1,152 @@
+"""
+Tests for the Redis query-result cache.
+"""
+import pytest
+import redis
+from utils import cache
+
+
+REDIS_URL = 'redis://cache-test'
+
+
+class StubRedis:
+    """In-memory stand-in for the few Redis commands the cache uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise redis.ConnectionError("Redis unavailable")
+
+    def get(self, key):
+        self._check()
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self._check()
+        self.store[key] = value
+
+    def incr(self, key):
+        self._check()
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+    def cached_pages(self, namespace):
+        return [key for key in self.store if key.startswith(f"{namespace}:v")]
+
+
+@pytest.fixture
+def stub_redis(app, monkeypatch):
+    """Enable caching with a stub Redis client for one test."""
+    client = StubRedis()
+    monkeypatch.setitem(app.config, 'REDIS_URL', REDIS_URL)
+    monkeypatch.setitem(cache._clients, REDIS_URL, client)
+    return client
+
+
+def test_cache_miss_then_hit(client, stub_redis):
+    """Test that a cached page is served from Redis on the second request."""
+    first = client.get('/api/v1/movies?page=1')
+    assert first.status_code == 200
+
+    keys = stub_redis.cached_pages('movies')
+    assert len(keys) == 1
+    assert keys[0].startswith('movies:v0:')
+    assert stub_redis.store[keys[0]] == first.get_data()
+
+    # Serve a marker body so the hit is distinguishable from a fresh render
+    stub_redis.store[keys[0]] = b'{"cached": true}'
+    second = client.get('/api/v1/movies?page=1')
+    assert second.status_code == 200
+    assert second.get_json() == {"cached": True}
+
+
+def test_cache_key_depends_on_query_string(client, stub_redis):
+    """Test that different query parameters are cached separately."""
+    client.get('/api/v1/movies?page=1')
+    client.get('/api/v1/movies?page=1&year=2020')
+    assert len(stub_redis.cached_pages('movies')) == 2
+
+
+def test_cache_key_escapes_parameter_values(client, stub_redis):
+    """Test that an encoded '&' in a value does not collide with two parameters."""
+    client.get('/api/v1/movies?search=x%26year%3D2020')
+    client.get('/api/v1/movies?search=x&year=2020')
+    assert len(stub_redis.cached_pages('movies')) == 2
+
+
+def test_cache_key_ignores_unknown_parameters(client, stub_redis):
+    """Test that parameters the view does not read share one cached page."""
+    client.get('/api/v1/movies?page=1')
+    client.get('/api/v1/movies?page=1&_=123')
+    client.get('/api/v1/movies?_=456&page=1')
+    assert len(stub_redis.cached_pages('movies')) == 1
+
+
+@pytest.mark.parametrize('method, url, payload', [
+    ('post', '/api/v1/genres', {"name": "Cache Genre"}),
+    ('put', '/api/v1/genres/{id}', {"name": "Renamed Cache Genre"}),
+    ('delete', '/api/v1/genres/{id}', None),
+], ids=['create', 'update', 'delete'])
+def test_successful_write_bumps_namespace_versions(
+    client, stub_redis, sample_genre, method, url, payload
+):
+    """Test that a successful write invalidates every affected namespace."""
+    client.get('/api/v1/genres')
+    assert stub_redis.cached_pages('genres')[0].startswith('genres:v0:')
+
+    response = getattr(client, method)(url.format(id=sample_genre.id), json=payload)
+    assert response.status_code < 300
+
+    for namespace in ('genres', 'movies', 'actors', 'directors'):
+        assert stub_redis.store[f"{namespace}:version"] == 1
+
+    # The next read misses and is stored under the new version
+    client.get('/api/v1/genres')
+    assert any(key.startswith('genres:v1:') for key in stub_redis.cached_pages('genres'))
+
+
+def test_failed_write_does_not_invalidate(client, stub_redis):
+    """Test that an unsuccessful write leaves namespace versions alone."""
+    response = client.put('/api/v1/genres/99999', json={"name": "Missing"})
+    assert response.status_code == 404
+    assert 'genres:version' not in stub_redis.store
+
+
+def test_error_responses_are_not_cached(client, stub_redis):
+    """Test that non-200 responses are not stored."""
+    response = client.get('/api/v1/movies?page=-1')
+    assert response.status_code == 400
+    assert stub_redis.cached_pages('movies') == []
+
+
+def test_streamed_responses_are_not_cached(client, stub_redis, populated_db):
+    """Test that streamed pages are passed through without being stored."""
+    response = client.get('/api/v1/actors?page_size=50')
+    assert response.status_code == 200
+    assert response.get_json()['meta']['total_items'] == 3
+    assert stub_redis.cached_pages('actors') == []
+
+
+def test_redis_error_falls_back_to_view(client, stub_redis):
+    """Test that reads and writes still work when Redis is unavailable."""
+    stub_redis.fail = True
+
+    response = client.get('/api/v1/movies')
+    assert response.status_code == 200
+    assert response.get_json()['success'] is True
+
+    response = client.post('/api/v1/genres', json={"name": "Offline Genre"})
+    assert response.status_code == 201
+    assert stub_redis.store == {}
+
+
+def test_cache_disabled_without_redis_url(client, app):
+    """Test that caching is skipped when REDIS_URL is unset."""
+    assert app.config['REDIS_URL'] is None
+
+    response = client.get('/api/v1/movies')
+    assert response.status_code == 200
+    assert cache._clients == {}
@@ -3,117 +3,83 @@ Integration tests for complete workflows.
 """
 import pytest
 import json
+from models import Actor, Director, Genre
+
+
+# Movie fields that don't depend on the rows created by each test
+MOVIE_PAYLOAD = {
+    "title": "Workflow Test Movie",
+    "description": "Complete workflow test",
+    "release_year": 2024,
+    "duration_minutes": 120,
+    "rating": 8.5
+}
 
 
 class TestMovieWorkflow:
     """Test complete movie creation workflow."""
     
-    def test_create_complete_movie_workflow(self, client):
+    def test_create_complete_movie_workflow(self, client, db_session):
         """Test creating a movie with all relationships."""
         
-        import time
-        unique_id = str(int(time.time() * 1000))  # Unique timestamp
-        
-        # Step 1: Create a director
-        director_data = {
-            "name": f"Workflow Director {unique_id}",
-            "bio": "Test director for workflow",
-            "nationality": "American"
-        }
-        director_response = client.post(
-            '/api/v1/directors',
-            data=json.dumps(director_data),
-            content_type='application/json'
+        # Step 1: Create the related director, actors and genre directly
+        director = Director(
+            name="Workflow Director",
+            bio="Test director for workflow",
+            nationality="American"
         )
-        assert director_response.status_code == 201
-        director_id = json.loads(director_response.data)['data']['id']
+        actor1 = Actor(name="Workflow Actor 1", bio="First test actor")
+        actor2 = Actor(name="Workflow Actor 2", bio="Second test actor")
+        genre1 = Genre(name="WorkflowGenre", description="First workflow genre")
+        db_session.add_all([director, actor1, actor2, genre1])
+        db_session.commit()
         
-        # Step 2: Create actors
-        actor1_data = {
-            "name": f"Workflow Actor 1 {unique_id}",
-            "bio": "First test actor"
-        }
-        actor1_response = client.post(
-            '/api/v1/actors',
-            data=json.dumps(actor1_data),
-            content_type='application/json'
-        )
-        assert actor1_response.status_code == 201
-        actor1_id = json.loads(actor1_response.data)['data']['id']
+        director_id = director.id
+        actor1_id, actor2_id = actor1.id, actor2.id
+        genre1_id = genre1.id
         
-        actor2_data = {
-            "name": f"Workflow Actor 2 {unique_id}",
-            "bio": "Second test actor"
-        }
-        actor2_response = client.post(
-            '/api/v1/actors',
-            data=json.dumps(actor2_data),
-            content_type='application/json'
-        )
-        assert actor2_response.status_code == 201
-        actor2_id = json.loads(actor2_response.data)['data']['id']
-        
-        # Step 3: Create genres with unique names
-        genre1_data = {
-            "name": f"WorkflowGenre{unique_id}",
-            "description": "First workflow genre"
-        }
-        genre1_response = client.post(
-            '/api/v1/genres',
-            data=json.dumps(genre1_data),
-            content_type='application/json'
-        )
-        assert genre1_response.status_code == 201
-        genre1_id = json.loads(genre1_response.data)['data']['id']
-        
-        # Step 4: Create movie with all relationships
+        # Step 2: Create movie with all relationships
         movie_data = {
-            "title": "Workflow Test Movie",
-            "description": "Complete workflow test",
-            "release_year": 2024,
-            "duration_minutes": 120,
-            "rating": 8.5,
+            **MOVIE_PAYLOAD,
             "director_id": director_id,
             "actor_ids": [actor1_id, actor2_id],
             "genre_ids": [genre1_id]
         }
         movie_response = client.post(
             '/api/v1/movies',
-            data=json.dumps(movie_data),
-            content_type='application/json'
+            json=movie_data
         )
         assert movie_response.status_code == 201
-        movie_id = json.loads(movie_response.data)['data']['id']
+        movie_id = movie_response.get_json()['data']['id']
         
-        # Step 5: Verify movie has all relationships
+        # Step 3: Verify movie has all relationships
         get_movie_response = client.get(f'/api/v1/movies/{movie_id}')
         assert get_movie_response.status_code == 200
-        movie_detail = json.loads(get_movie_response.data)['data']
+        movie_detail = get_movie_response.get_json()['data']
         
         assert movie_detail['director']['id'] == director_id
         assert len(movie_detail['actors']) == 2
         assert len(movie_detail['genres']) == 1
         
-        # Step 6: Update movie
+        # Step 4: Update movie
         update_data = {
             "rating": 9.0
         }
         update_response = client.put(
             f'/api/v1/movies/{movie_id}',
-            data=json.dumps(update_data),
-            content_type='application/json'
+            json=update_data
         )
         assert update_response.status_code == 200
         
-        # Step 7: Verify update
+        # Step 5: Verify update
         updated_movie = client.get(f'/api/v1/movies/{movie_id}')
-        assert json.loads(updated_movie.data)['data']['rating'] == 9.0
+        assert updated_movie.get_json()['data']['rating'] == 9.0
         
-        # Step 8: Delete movie
+        # Step 6: Delete movie
         delete_response = client.delete(f'/api/v1/movies/{movie_id}')
         assert delete_response.status_code == 200
         
-        # Step 9: Verify deletion
+        # Step 7: Verify deletion
         verify_response = client.get(f'/api/v1/movies/{movie_id}')
         assert verify_response.status_code == 404
 
@@ -125,14 +91,14 @@ class TestAPIHealthAndMeta:
         """Test health check endpoint."""
         response = client.get('/health')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['status'] == 'healthy'
     
     def test_root_endpoint(self, client):
         """Test root endpoint."""
         response = client.get('/')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'message' in data
         assert 'version' in data
 
@@ -140,6 +106,16 @@ class TestAPIHealthAndMeta:
 class TestErrorHandling:
     """Test error handling across endpoints."""
     
+    @pytest.mark.parametrize('endpoint, payload', [
+        ('/api/v1/actors', {"bio": "Test bio", "nationality": "American"}),
+        ('/api/v1/directors', {"bio": "Test bio"}),
+        ('/api/v1/genres', {"description": "Test description"}),
+    ])
+    def test_create_missing_name(self, client, endpoint, payload):
+        """Test creating an actor, director or genre without a name."""
+        response = client.post(endpoint, json=payload)
+        assert response.status_code == 422
+    
     def test_404_for_invalid_route(self, client):
         """Test 404 for non-existent route."""
         response = client.get('/api/v1/invalid-route')
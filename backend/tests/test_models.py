@@ -3,23 +3,10 @@ Unit tests for database models.
 """
 import pytest
 from datetime import date
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from database import Base
+from sqlalchemy.exc import IntegrityError
 from models import Movie, Actor, Director, Genre
 
 
-@pytest.fixture
-def db_session():
-    """Create a test database session."""
-    engine = create_engine('sqlite:///:memory:')
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
-
-
 class TestDirectorModel:
     """Test cases for Director model."""
     
@@ -102,7 +89,7 @@ class TestGenreModel:
         genre2 = Genre(name="Comedy")
         db_session.add(genre2)
         
-        with pytest.raises(Exception):
+        with pytest.raises(IntegrityError):
             db_session.commit()
 
 
@@ -148,7 +135,7 @@ class TestMovieModel:
         db_session.commit()
         
         assert movie.actors.count() == 2
-        assert actor1.movies.count() == 1
+        assert len(actor1.movies) == 1
     
     def test_movie_with_genres(self, db_session):
         """Test movie with genres (many-to-many)."""
@@ -170,6 +157,24 @@ class TestMovieModel:
         assert movie.genres.count() == 2
         assert genre1.movies.count() == 1
     
+    def test_genre_events_sync_genre_names(self, db_session):
+        """Test that ORM genre appends and removes keep genre_names sorted and current."""
+        movie = Movie(title="Alien", release_year=1979, rating=8.5)
+        horror = Genre(name="Horror")
+        scifi = Genre(name="Sci-Fi")
+        db_session.add_all([movie, horror, scifi])
+        db_session.commit()
+        
+        movie.genres.append(scifi)
+        movie.genres.append(horror)
+        db_session.commit()
+        assert movie.genre_names == ["Horror", "Sci-Fi"]
+        
+        movie.genres.remove(scifi)
+        db_session.commit()
+        db_session.expire(movie)
+        assert movie.genre_names == ["Horror"]
+    
     def test_movie_rating_constraint(self, db_session):
         """Test that movie rating must be between 0 and 10."""
         movie = Movie(
@@ -179,7 +184,7 @@ class TestMovieModel:
         )
         db_session.add(movie)
         
-        with pytest.raises(Exception):
+        with pytest.raises(IntegrityError):
             db_session.commit()
     
     def test_movie_to_dict(self, db_session):
@@ -2,119 +2,176 @@
 Tests for actor routes.
 """
 import pytest
-import json
+from sqlalchemy import event
+from database import SessionLocal, engine
+from services import ActorService
 
 
-class TestActorsRoutes:
-    """Test cases for actor endpoints."""
-    
-    def test_get_actors(self, client):
-        """Test getting all actors."""
-        response = client.get('/api/v1/actors')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['success'] is True
-        assert isinstance(data['data'], list)
-        assert 'meta' in data
-    
-    def test_get_actors_with_pagination(self, client):
-        """Test actors pagination."""
-        response = client.get('/api/v1/actors?page=1&page_size=10')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['meta']['page'] == 1
-        assert data['meta']['page_size'] == 10
-    
-    def test_get_actors_with_movies(self, client):
-        """Test getting actors with their movies."""
+ACTOR_PAYLOAD = {
+    "name": "New Test Actor",
+    "bio": "A new test actor",
+    "birth_date": "1990-01-01",
+    "nationality": "American"
+}
+
+
+def test_get_actors(client, populated_db):
+    """Test getting all actors."""
+    response = client.get('/api/v1/actors')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success'] is True
+    assert isinstance(data['data'], list)
+    assert 'meta' in data
+    assert data['meta']['total_items'] == 3
+
+
+def test_get_actors_with_pagination(client, populated_db):
+    """Test actors pagination."""
+    response = client.get('/api/v1/actors?page=2&page_size=2')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['meta']['page'] == 2
+    assert data['meta']['page_size'] == 2
+    assert len(data['data']) == 1
+
+
+def test_get_actors_with_movies(client, populated_db):
+    """Test getting actors with their movies."""
+    response = client.get('/api/v1/actors?include_movies=true')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert sorted(actor['movie_count'] for actor in data['data']) == [1, 2, 2]
+
+
+def test_get_actors_with_movies_genres(client, populated_db):
+    """Test per-movie and distinct genre names in the filmography view."""
+    response = client.get('/api/v1/actors?include_movies=true')
+    actor = next(a for a in response.get_json()['data'] if a['name'] == "Populated Actor 2")
+    assert sorted(movie['title'] for movie in actor['movies']) == [
+        "Populated Movie 1", "Populated Movie 2"
+    ]
+    assert sorted(movie['genres'] for movie in actor['movies']) == [
+        ["Comedy", "Thriller"], ["Thriller"]
+    ]
+    assert actor['genres'] == ["Comedy", "Thriller"]
+
+
+def test_get_actors_with_movies_query_count(client, populated_db):
+    """Test that the filmography list does not issue queries per actor or movie."""
+    selects = []
+
+    def count_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            selects.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', count_selects)
+    try:
         response = client.get('/api/v1/actors?include_movies=true')
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_selects)
+
+    assert response.status_code == 200
+    # Count, page of actors, and one selectin load of their movies
+    assert len(selects) == 3
+
+
+def test_get_actors_streamed(client, populated_db):
+    """Test that large pages stream the same envelope as regular pages."""
+    response = client.get('/api/v1/actors?page_size=50&include_movies=true')
+    assert response.status_code == 200
+    assert response.is_streamed
+    data = response.get_json()
+    assert data['success'] is True
+    assert data['meta']['page_size'] == 50
+    assert data['meta']['total_items'] == 3
+    assert sorted(actor['name'] for actor in data['data']) == [
+        "Populated Actor 1", "Populated Actor 2", "Populated Actor 3"
+    ]
+    assert sorted(actor['movie_count'] for actor in data['data']) == [1, 2, 2]
+
+
+def test_head_streamed_actors_closes_session(client, populated_db):
+    """Test that a streamed page releases its session without being iterated."""
+    with client.head('/api/v1/actors?page_size=50') as response:
         assert response.status_code == 200
-    
-    def test_get_actor_not_found(self, client):
-        """Test getting non-existent actor."""
-        response = client.get('/api/v1/actors/99999')
-        assert response.status_code == 404
-        data = json.loads(response.data)
-        assert data['success'] is False
-    
-    def test_create_actor_success(self, client):
-        """Test creating an actor successfully."""
-        actor_data = {
-            "name": "New Test Actor",
-            "bio": "A new test actor",
-            "birth_date": "1990-01-01",
-            "nationality": "American"
-        }
-        
-        response = client.post(
-            '/api/v1/actors',
-            data=json.dumps(actor_data),
-            content_type='application/json'
-        )
-        
-        assert response.status_code == 201
-        data = json.loads(response.data)
-        assert data['success'] is True
-        assert data['data']['name'] == actor_data['name']
-    
-    def test_create_actor_missing_name(self, client):
-        """Test creating actor without name."""
-        actor_data = {
-            "bio": "Test bio",
-            "nationality": "American"
-        }
-        
-        response = client.post(
-            '/api/v1/actors',
-            data=json.dumps(actor_data),
-            content_type='application/json'
-        )
-        
-        assert response.status_code == 422
-    
-    def test_create_actor_empty_name(self, client):
-        """Test creating actor with empty name."""
-        actor_data = {
-            "name": "   ",
-            "bio": "Test bio"
-        }
-        
-        response = client.post(
-            '/api/v1/actors',
-            data=json.dumps(actor_data),
-            content_type='application/json'
-        )
-        
-        assert response.status_code == 422
-    
-    def test_create_actor_future_birth_date(self, client):
-        """Test creating actor with future birth date."""
-        actor_data = {
-            "name": "Test Actor",
-            "birth_date": "2030-01-01"
-        }
-        
-        response = client.post(
-            '/api/v1/actors',
-            data=json.dumps(actor_data),
-            content_type='application/json'
-        )
-        
-        assert response.status_code == 422
-    
-    def test_update_actor_not_found(self, client):
-        """Test updating non-existent actor."""
-        actor_data = {"name": "Updated Name"}
-        
-        response = client.put(
-            '/api/v1/actors/99999',
-            data=json.dumps(actor_data),
-            content_type='application/json'
-        )
-        
-        assert response.status_code == 404
-    
-    def test_delete_actor_not_found(self, client):
-        """Test deleting non-existent actor."""
-        response = client.delete('/api/v1/actors/99999')
-        assert response.status_code == 404
\ No newline at end of file
+
+    assert not SessionLocal().in_transaction()
+
+
+def test_get_actors_streamed_serialization_error(client, populated_db, monkeypatch):
+    """Test that a mid-stream failure ends the envelope with an error."""
+    serialize_summary = ActorService.serialize_summary
+    calls = []
+
+    def failing_serialize(actor):
+        calls.append(actor)
+        if len(calls) > 1:
+            raise RuntimeError("serialization failed")
+        return serialize_summary(actor)
+
+    monkeypatch.setattr(ActorService, 'serialize_summary', failing_serialize)
+
+    response = client.get('/api/v1/actors?page_size=50')
+    data = response.get_json()
+    assert data['success'] is False
+    assert data['error'] == "Error streaming results"
+    assert len(data['data']) == 1
+
+
+def test_get_actors_streamed_first_item_error(client, populated_db, monkeypatch):
+    """Test that a failure before streaming starts still returns a 500."""
+    def failing_serialize(actor):
+        raise RuntimeError("serialization failed")
+
+    monkeypatch.setattr(ActorService, 'serialize_summary', failing_serialize)
+
+    response = client.get('/api/v1/actors?page_size=50')
+    assert response.status_code == 500
+    assert response.get_json()['success'] is False
+
+
+def test_get_actor_not_found(client, populated_db):
+    """Test getting non-existent actor."""
+    response = client.get('/api/v1/actors/99999')
+    assert response.status_code == 404
+    data = response.get_json()
+    assert data['success'] is False
+
+
+def test_create_actor_success(client):
+    """Test creating an actor successfully."""
+    response = client.post('/api/v1/actors', json=ACTOR_PAYLOAD)
+
+    assert response.status_code == 201
+    data = response.get_json()
+    assert data['success'] is True
+    assert data['data']['name'] == ACTOR_PAYLOAD['name']
+
+
+@pytest.mark.parametrize('actor_data', [
+    {"name": "   ", "bio": "Test bio"},
+    {"name": "Test Actor", "birth_date": "2030-01-01"},
+], ids=['empty_name', 'future_birth_date'])
+def test_create_actor_invalid(client, actor_data):
+    """Test creating actor with an invalid name or birth date."""
+    response = client.post('/api/v1/actors', json=actor_data)
+    assert response.status_code == 422
+
+
+def test_update_actor_not_found(client):
+    """Test updating non-existent actor."""
+    actor_data = {"name": "Updated Name"}
+
+    response = client.put(
+        '/api/v1/actors/99999',
+        json=actor_data
+    )
+
+    assert response.status_code == 404
+
+
+def test_delete_actor_not_found(client):
+    """Test deleting non-existent actor."""
+    response = client.delete('/api/v1/actors/99999')
+    assert response.status_code == 404
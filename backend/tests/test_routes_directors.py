@@ -2,79 +2,76 @@
 Tests for director routes.
 """
 import pytest
-import json
-
-
-class TestDirectorsRoutes:
-    """Test cases for director endpoints."""
-    
-    def test_get_directors(self, client):
-        """Test getting all directors."""
-        response = client.get('/api/v1/directors')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['success'] is True
-        assert isinstance(data['data'], list)
-    
-    def test_get_directors_with_pagination(self, client):
-        """Test directors pagination."""
-        response = client.get('/api/v1/directors?page=1&page_size=10')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['meta']['page'] == 1
-    
-    def test_get_director_not_found(self, client):
-        """Test getting non-existent director."""
-        response = client.get('/api/v1/directors/99999')
-        assert response.status_code == 404
-    
-    def test_create_director_success(self, client):
-        """Test creating a director successfully."""
-        director_data = {
-            "name": "New Test Director",
-            "bio": "A new test director",
-            "birth_date": "1970-01-01",
-            "nationality": "British"
-        }
-        
-        response = client.post(
-            '/api/v1/directors',
-            data=json.dumps(director_data),
-            content_type='application/json'
-        )
-        
-        assert response.status_code == 201
-        data = json.loads(response.data)
-        assert data['success'] is True
-        assert data['data']['name'] == director_data['name']
-    
-    def test_create_director_missing_name(self, client):
-        """Test creating director without name."""
-        director_data = {
-            "bio": "Test bio"
-        }
-        
-        response = client.post(
-            '/api/v1/directors',
-            data=json.dumps(director_data),
-            content_type='application/json'
-        )
-        
-        assert response.status_code == 422
-    
-    def test_update_director_not_found(self, client):
-        """Test updating non-existent director."""
-        director_data = {"name": "Updated Name"}
-        
-        response = client.put(
-            '/api/v1/directors/99999',
-            data=json.dumps(director_data),
-            content_type='application/json'
-        )
-        
-        assert response.status_code == 404
-    
-    def test_delete_director_not_found(self, client):
-        """Test deleting non-existent director."""
-        response = client.delete('/api/v1/directors/99999')
-        assert response.status_code == 404
\ No newline at end of file
+
+
+DIRECTOR_PAYLOAD = {
+    "name": "New Test Director",
+    "bio": "A new test director",
+    "birth_date": "1970-01-01",
+    "nationality": "British"
+}
+
+
+def test_get_directors(client, populated_db):
+    """Test getting all directors."""
+    response = client.get('/api/v1/directors')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success'] is True
+    assert isinstance(data['data'], list)
+    assert data['meta']['total_items'] == 2
+
+
+def test_get_directors_with_pagination(client, populated_db):
+    """Test directors pagination."""
+    response = client.get('/api/v1/directors?page=1&page_size=10')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['meta']['page'] == 1
+
+
+def test_get_directors_streamed(client, populated_db):
+    """Test that large pages stream the same envelope as regular pages."""
+    response = client.get('/api/v1/directors?page_size=50')
+    assert response.status_code == 200
+    assert response.is_streamed
+    data = response.get_json()
+    assert data['success'] is True
+    assert data['meta']['total_items'] == 2
+    assert sorted(director['name'] for director in data['data']) == [
+        "Populated Director One", "Populated Director Two"
+    ]
+
+
+def test_get_director_not_found(client, populated_db):
+    """Test getting non-existent director."""
+    response = client.get('/api/v1/directors/99999')
+    assert response.status_code == 404
+
+
+def test_create_director_success(client):
+    """Test creating a director successfully."""
+    response = client.post('/api/v1/directors', json=DIRECTOR_PAYLOAD)
+
+    assert response.status_code == 201
+    data = response.get_json()
+    assert data['success'] is True
+    assert data['data']['name'] == DIRECTOR_PAYLOAD['name']
+
+
+def test_update_director_not_found(client):
+    """Test updating non-existent director."""
+    director_data = {"name": "Updated Name"}
+
+    response = client.put(
+        '/api/v1/directors/99999',
+        json=director_data
+    )
+
+    assert response.status_code == 404
+
+
+def test_delete_director_not_found(client):
+    """Test deleting non-existent director."""
+    response = client.delete('/api/v1/directors/99999')
+    assert response.status_code == 404
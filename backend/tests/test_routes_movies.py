@@ -3,6 +3,9 @@ Tests for movie routes.
 """
 import pytest
 import json
+from sqlalchemy import event
+from database import engine
+from models import Actor, Genre, Movie
 
 
 class TestMoviesRoutes:
@@ -12,7 +15,7 @@ class TestMoviesRoutes:
         """Test getting movies when database is empty."""
         response = client.get('/api/v1/movies')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert isinstance(data['data'], list)
         assert 'meta' in data
@@ -21,7 +24,7 @@ class TestMoviesRoutes:
         """Test movies pagination."""
         response = client.get('/api/v1/movies?page=1&page_size=10')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'meta' in data
         assert data['meta']['page'] == 1
         assert data['meta']['page_size'] == 10
@@ -30,41 +33,29 @@ class TestMoviesRoutes:
         """Test movies with invalid page number."""
         response = client.get('/api/v1/movies?page=-1')
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
     
-    def test_get_movies_with_genre_filter(self, client):
-        """Test filtering movies by genre."""
-        response = client.get('/api/v1/movies?genre=Action')
+    @pytest.mark.parametrize('qs', [
+        'genre=Action',
+        'director=Nolan',
+        'year=2020',
+        'min_rating=8.0&max_rating=10.0',
+        'search=test',
+        'genre=Sci-Fi&min_rating=8.0&year=2020',
+    ])
+    def test_get_movies_with_filters(self, client, qs):
+        """Test filtering movies by genre, director, year, rating and search."""
+        response = client.get(f'/api/v1/movies?{qs}')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
     
-    def test_get_movies_with_director_filter(self, client):
-        """Test filtering movies by director."""
-        response = client.get('/api/v1/movies?director=Nolan')
-        assert response.status_code == 200
-    
-    def test_get_movies_with_year_filter(self, client):
-        """Test filtering movies by year."""
-        response = client.get('/api/v1/movies?year=2020')
-        assert response.status_code == 200
-    
-    def test_get_movies_with_rating_filter(self, client):
-        """Test filtering movies by rating range."""
-        response = client.get('/api/v1/movies?min_rating=8.0&max_rating=10.0')
-        assert response.status_code == 200
-    
-    def test_get_movies_with_search(self, client):
-        """Test searching movies."""
-        response = client.get('/api/v1/movies?search=test')
-        assert response.status_code == 200
-    
     def test_get_movie_not_found(self, client):
         """Test getting non-existent movie."""
         response = client.get('/api/v1/movies/99999')
         assert response.status_code == 404
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
         assert 'not found' in data['error'].lower()
     
@@ -85,7 +76,7 @@ class TestMoviesRoutes:
         )
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert data['data']['title'] == movie_data['title']
     
@@ -103,7 +94,7 @@ class TestMoviesRoutes:
         )
         
         assert response.status_code == 422
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is False
     
     def test_create_movie_invalid_year(self, client):
@@ -159,13 +150,6 @@ class TestMoviesRoutes:
 class TestMovieFiltering:
     """Test cases for movie filtering functionality."""
     
-    def test_filter_by_multiple_criteria(self, client):
-        """Test filtering by multiple criteria."""
-        response = client.get('/api/v1/movies?genre=Sci-Fi&min_rating=8.0&year=2020')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['success'] is True
-    
     def test_search_in_title_and_description(self, client):
         """Test search functionality."""
         response = client.get('/api/v1/movies?search=inception')
@@ -175,10 +159,239 @@ class TestMovieFiltering:
         """Test pagination works with filters."""
         response = client.get('/api/v1/movies?genre=Action&page=1&page_size=5')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'meta' in data
 
 
+class TestMovieKeysetPagination:
+    """Test cases for newest-first ordering and cursor pagination."""
+    
+    @pytest.fixture
+    def same_year_movies(self, db_session, multiple_movies):
+        """Add two movies sharing a release year with one of multiple_movies."""
+        movies = [Movie(title=f"Same Year {i}", release_year=2022, rating=5.0) for i in range(2)]
+        db_session.add_all(movies)
+        db_session.commit()
+        return movies
+    
+    def test_movies_ordered_by_year_then_id_desc(self, client, same_year_movies):
+        """Test that movies are listed newest first, ties broken by highest ID."""
+        data = client.get('/api/v1/movies?page_size=100').get_json()['data']
+        keys = [(movie['release_year'], movie['id']) for movie in data]
+        assert len(keys) == 7
+        assert keys == sorted(keys, reverse=True)
+    
+    @pytest.mark.parametrize('page_size', [1, 2, 3])
+    def test_cursor_walks_every_movie_once(self, client, same_year_movies, page_size):
+        """Test that following next_cursor visits every movie once, in order."""
+        expected = [
+            movie['id']
+            for movie in client.get('/api/v1/movies?page_size=100').get_json()['data']
+        ]
+        
+        first = client.get(f'/api/v1/movies?page_size={page_size}').get_json()
+        seen = [movie['id'] for movie in first['data']]
+        last = first['data'][-1]
+        cursor = {'after_year': last['release_year'], 'after_id': last['id']}
+        
+        while cursor:
+            response = client.get('/api/v1/movies', query_string={
+                'page_size': page_size, **cursor
+            })
+            assert response.status_code == 200
+            body = response.get_json()
+            meta = body['meta']
+            
+            assert 'page' not in meta and 'has_prev' not in meta
+            assert meta['total_items'] == 7
+            assert meta['has_next'] is (meta['next_cursor'] is not None)
+            assert 0 < len(body['data']) <= page_size
+            
+            seen.extend(movie['id'] for movie in body['data'])
+            cursor = meta['next_cursor']
+        
+        assert seen == expected
+    
+    def test_cursor_past_last_movie(self, client, multiple_movies):
+        """Test that a cursor after the oldest movie returns an empty last page."""
+        response = client.get('/api/v1/movies?after_year=1900&after_id=1')
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body['data'] == []
+        assert body['meta']['has_next'] is False
+        assert body['meta']['next_cursor'] is None
+    
+    @pytest.mark.parametrize('qs', [
+        'after_year=2020',
+        'after_id=3',
+        'after_year=abc&after_id=3',
+    ])
+    def test_cursor_requires_both_integer_parts(self, client, qs):
+        """Test that an incomplete or non-numeric cursor is rejected."""
+        response = client.get(f'/api/v1/movies?{qs}')
+        assert response.status_code == 400
+
+
+class TestMovieToManyFilters:
+    """Test cases for filtering movies by genre and actor."""
+    
+    @pytest.fixture
+    def multi_match_movie(self, db_session):
+        """Create a movie whose genres and actors each match a filter twice."""
+        movie = Movie(title="Double Match", release_year=2021, rating=7.0)
+        movie.genres = [Genre(name="Space Opera"), Genre(name="Space Western")]
+        movie.actors = [Actor(name="Pat Smith"), Actor(name="Sam Smith")]
+        db_session.add(movie)
+        db_session.commit()
+        return movie
+    
+    @pytest.mark.parametrize('qs', ['genre=Space', 'actor=Smith', 'genre=Space&actor=Smith'])
+    def test_movie_listed_once_per_filter_match(self, client, multi_match_movie, qs):
+        """Test that several matching genres or actors do not duplicate a movie."""
+        body = client.get(f'/api/v1/movies?{qs}').get_json()
+        assert [movie['id'] for movie in body['data']] == [multi_match_movie.id]
+        assert body['meta']['total_items'] == 1
+    
+    def test_filters_do_not_use_distinct(self, client, multi_match_movie):
+        """Test that filtered pages avoid DISTINCT so the ordering index is usable."""
+        selects = []
+        
+        def capture_selects(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith('SELECT'):
+                selects.append(statement)
+        
+        event.listen(engine, 'before_cursor_execute', capture_selects)
+        try:
+            response = client.get('/api/v1/movies?genre=Space&actor=Smith&director=x')
+        finally:
+            event.remove(engine, 'before_cursor_execute', capture_selects)
+        
+        assert response.status_code == 200
+        assert selects
+        assert not any('DISTINCT' in statement.upper() for statement in selects)
+
+
+class TestMovieLinkReplacement:
+    """Test cases for replacing a movie's actors and genres on update."""
+    
+    @staticmethod
+    def linked_ids(client, movie_id, relation):
+        """Return the sorted IDs of a movie's actors or genres from the detail view."""
+        movie = client.get(f'/api/v1/movies/{movie_id}').get_json()['data']
+        return sorted(item['id'] for item in movie[relation])
+    
+    @pytest.mark.parametrize('field, relation, message', [
+        ('actor_ids', 'actors', "One or more actor IDs not found"),
+        ('genre_ids', 'genres', "One or more genre IDs not found"),
+    ])
+    def test_unknown_ids_rejected(
+        self, client, sample_movie, sample_actor, sample_genre, field, relation, message
+    ):
+        """Test that unknown IDs fail with 404 and leave existing links intact."""
+        before = self.linked_ids(client, sample_movie.id, relation)
+        
+        response = client.put(f'/api/v1/movies/{sample_movie.id}', json={field: [99999]})
+        assert response.status_code == 404
+        assert response.get_json()['error'] == message
+        assert self.linked_ids(client, sample_movie.id, relation) == before
+    
+    def test_links_replaced(self, client, db_session, sample_movie, sample_actor, sample_genre):
+        """Test that new IDs replace, rather than extend, the existing links."""
+        actor = Actor(name="Replacement Actor")
+        genre = Genre(name="Replacement Genre")
+        db_session.add_all([actor, genre])
+        db_session.commit()
+        
+        response = client.put(
+            f'/api/v1/movies/{sample_movie.id}',
+            json={"actor_ids": [actor.id], "genre_ids": [genre.id, sample_genre.id]}
+        )
+        assert response.status_code == 200
+        assert self.linked_ids(client, sample_movie.id, 'actors') == [actor.id]
+        assert self.linked_ids(client, sample_movie.id, 'genres') == sorted(
+            [genre.id, sample_genre.id]
+        )
+    
+    def test_duplicate_ids_deduplicated(self, client, sample_movie, sample_actor, sample_genre):
+        """Test that repeated IDs create a single link."""
+        response = client.put(
+            f'/api/v1/movies/{sample_movie.id}',
+            json={
+                "actor_ids": [sample_actor.id, sample_actor.id],
+                "genre_ids": [sample_genre.id] * 3
+            }
+        )
+        assert response.status_code == 200
+        assert self.linked_ids(client, sample_movie.id, 'actors') == [sample_actor.id]
+        assert self.linked_ids(client, sample_movie.id, 'genres') == [sample_genre.id]
+    
+    def test_null_clears_links(self, client, sample_movie, sample_actor, sample_genre):
+        """Test that explicit nulls remove every actor and genre link."""
+        response = client.put(
+            f'/api/v1/movies/{sample_movie.id}',
+            json={"actor_ids": None, "genre_ids": None}
+        )
+        assert response.status_code == 200
+        assert self.linked_ids(client, sample_movie.id, 'actors') == []
+        assert self.linked_ids(client, sample_movie.id, 'genres') == []
+    
+    def test_omitted_ids_keep_links(self, client, sample_movie, sample_actor, sample_genre):
+        """Test that an update without actor_ids or genre_ids leaves the links alone."""
+        response = client.put(f'/api/v1/movies/{sample_movie.id}', json={"rating": 9.0})
+        assert response.status_code == 200
+        assert self.linked_ids(client, sample_movie.id, 'actors') == [sample_actor.id]
+        assert self.linked_ids(client, sample_movie.id, 'genres') == [sample_genre.id]
+    
+    def test_empty_lists_clear_links(self, client, sample_movie):
+        """Test that empty lists remove every link."""
+        response = client.put(
+            f'/api/v1/movies/{sample_movie.id}',
+            json={"actor_ids": [], "genre_ids": []}
+        )
+        assert response.status_code == 200
+        assert self.linked_ids(client, sample_movie.id, 'actors') == []
+        assert self.linked_ids(client, sample_movie.id, 'genres') == []
+
+
+class TestMovieGenreNames:
+    """Test cases for keeping list-view genre names in sync."""
+    
+    @staticmethod
+    def list_genres(client, movie_id):
+        """Return the genre names the movie list shows for one movie."""
+        movies = client.get('/api/v1/movies').get_json()['data']
+        return next(movie['genres'] for movie in movies if movie['id'] == movie_id)
+    
+    def test_update_movie_genre_ids(self, client, db_session, sample_movie, sample_genre):
+        """Test that replacing genre_ids updates the listed genres."""
+        comedy = Genre(name="Comedy")
+        db_session.add(comedy)
+        db_session.commit()
+        
+        response = client.put(
+            f'/api/v1/movies/{sample_movie.id}',
+            json={"genre_ids": [comedy.id, sample_genre.id]}
+        )
+        assert response.status_code == 200
+        assert self.list_genres(client, sample_movie.id) == ["Action", "Comedy"]
+        
+        response = client.put(f'/api/v1/movies/{sample_movie.id}', json={"genre_ids": [comedy.id]})
+        assert response.status_code == 200
+        assert self.list_genres(client, sample_movie.id) == ["Comedy"]
+    
+    def test_rename_genre(self, client, sample_movie, sample_genre):
+        """Test that renaming a genre updates the movies tagged with it."""
+        response = client.put(f'/api/v1/genres/{sample_genre.id}', json={"name": "Adventure"})
+        assert response.status_code == 200
+        assert self.list_genres(client, sample_movie.id) == ["Adventure"]
+    
+    def test_delete_genre(self, client, sample_movie, sample_genre):
+        """Test that deleting a genre removes it from the movies tagged with it."""
+        response = client.delete(f'/api/v1/genres/{sample_genre.id}')
+        assert response.status_code in (200, 204)
+        assert self.list_genres(client, sample_movie.id) == []
+
+
 class TestMovieRelationships:
     """Test cases for movie relationships."""
     
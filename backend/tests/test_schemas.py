@@ -9,7 +9,8 @@ from schemas import (
     MovieUpdate,
     ActorCreate,
     DirectorCreate,
-    GenreCreate
+    GenreCreate,
+    GenreUpdate
 )
 
 
@@ -208,6 +209,20 @@ class TestGenreSchemas:
         """Test genre name max length constraint."""
         with pytest.raises(ValidationError):
             GenreCreate(name="A" * 51)  # Too long
+    
+    def test_genre_update_null_name(self):
+        """Test that an explicit null genre name is rejected on update."""
+        with pytest.raises(ValidationError):
+            GenreUpdate(name=None)
+    
+    def test_genre_update_name_optional(self):
+        """Test that an omitted genre name is not part of the update."""
+        genre = GenreUpdate(description="New description")
+        assert 'name' not in genre.model_fields_set
+    
+    def test_genre_update_name_trimmed(self):
+        """Test that an updated genre name is trimmed."""
+        assert GenreUpdate(name="  Horror  ").name == "Horror"
 
 
 class TestSchemaIntegration:
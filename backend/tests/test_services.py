@@ -0,0 +1,53 @@
+"""
+Unit tests for service layer logic.
+"""
+import pytest
+from sqlalchemy import null, update
+from sqlalchemy.exc import IntegrityError
+from models import Movie
+from schemas import GenreCreate, GenreUpdate
+from services import GenreService, MovieService
+
+
+class TestGenreNamesBackfill:
+    """Test cases for backfilling the denormalized genre_names column."""
+    
+    def test_backfill_fills_missing_genre_names(self, db_session, multiple_movies):
+        """Test that movies without genre_names are filled from their genres."""
+        stale, *current = multiple_movies
+        # SQL NULL, as left in rows that existed before the column was added
+        db_session.execute(
+            update(Movie).where(Movie.id == stale.id).values(genre_names=null())
+        )
+        db_session.expire_all()
+        
+        assert MovieService.backfill_genre_names(db_session, batch_size=2) == 1
+        
+        db_session.expire_all()
+        assert stale.genre_names == ["Sci-Fi"]
+        assert [movie.genre_names for movie in current] == [
+            ["Drama"], ["Sci-Fi"], ["Drama"], ["Sci-Fi"]
+        ]
+    
+    def test_backfill_is_a_no_op_when_filled(self, db_session, multiple_movies):
+        """Test that a second backfill run finds nothing to do."""
+        assert MovieService.backfill_genre_names(db_session) == 0
+
+
+class TestGenreServiceIntegrityErrors:
+    """Test cases for translating genre integrity errors."""
+    
+    def test_duplicate_name_raises_value_error(self, db_session, sample_genre):
+        """Test that a unique name violation is reported as a duplicate."""
+        other = GenreService.create_genre(db_session, GenreCreate(name="Horror"))
+        
+        with pytest.raises(ValueError, match="already exists"):
+            GenreService.update_genre(db_session, other.id, GenreUpdate(name=sample_genre.name))
+    
+    def test_other_integrity_errors_propagate(self, db_session, sample_genre):
+        """Test that non-unique integrity failures are not reported as duplicates."""
+        # Bypass validation to reach the NOT NULL constraint
+        genre_data = GenreUpdate.model_construct(_fields_set={'name'}, name=None)
+        
+        with pytest.raises(IntegrityError):
+            GenreService.update_genre(db_session, sample_genre.id, genre_data)
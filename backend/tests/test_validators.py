@@ -0,0 +1,36 @@
+"""
+Unit tests for validation utilities.
+"""
+import pytest
+from utils.validators import validate_id, validate_page_number, validate_page_size
+
+
+@pytest.mark.parametrize('id_value, expected', [
+    (1, True),
+    (0, False),
+    (-5, False),
+    ("42", True),
+    ("0", False),
+    ("abc", False),
+    (None, False),
+    ([1], False),
+    ({"id": 1}, False),
+], ids=['int', 'zero', 'negative', 'numeric_str', 'zero_str', 'non_numeric_str',
+        'none', 'list', 'dict'])
+def test_validate_id(id_value, expected):
+    """Test that validate_id accepts positive IDs and rejects anything else."""
+    assert validate_id(id_value) is expected
+
+
+def test_validate_page_number():
+    """Test page number validation."""
+    assert validate_page_number(1) is True
+    assert validate_page_number(0) is False
+
+
+def test_validate_page_size():
+    """Test page size validation against the default and a custom maximum."""
+    assert validate_page_size(100) is True
+    assert validate_page_size(101) is False
+    assert validate_page_size(0) is False
+    assert validate_page_size(50, max_size=20) is False
@@ -8,6 +8,8 @@ from utils.response import (
     created_response,
     validation_error_response,
     paginated_response,
+    cursor_paginated_response,
+    stream_paginated_response,
     no_content_response,
     unauthorized_response,
     forbidden_response,
@@ -32,6 +34,8 @@ __all__ = [
     'created_response',
     'validation_error_response',
     'paginated_response',
+    'cursor_paginated_response',
+    'stream_paginated_response',
     'no_content_response',
     'unauthorized_response',
     'forbidden_response',
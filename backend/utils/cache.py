@@ -0,0 +1,173 @@
+"""
+Query-result caching for read-heavy list endpoints.
+Rendered JSON responses are stored in Redis and invalidated per namespace.
+"""
+import hashlib
+from functools import wraps
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlencode
+from flask import Response, current_app, make_response, request
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is optional
+    redis = None
+
+_clients = {}
+
+
+def _get_client():
+    """
+    Get the Redis client for the current app, if caching is enabled.
+
+    Returns:
+        Redis client or None when redis is not installed or REDIS_URL is unset
+    """
+    url = current_app.config.get('REDIS_URL')
+    if redis is None or not url:
+        return None
+
+    client = _clients.get(url)
+    if client is None:
+        client = redis.Redis.from_url(url, socket_timeout=0.5)
+        _clients[url] = client
+    return client
+
+
+def _query_key(params: Iterable[str]) -> str:
+    """
+    Build a cache key source from the query parameters a view reads.
+
+    Only the first value of each listed parameter is used, matching
+    ``request.args.get``. Values are URL-encoded, so an escaped ``&`` or
+    ``=`` inside a value cannot collide with a different parameter set.
+
+    Args:
+        params: Names of the query parameters the view reads
+
+    Returns:
+        URL-encoded parameters in a fixed order
+    """
+    return urlencode([
+        (name, request.args[name]) for name in sorted(params) if name in request.args
+    ])
+
+
+def _namespace_version(client, namespace: str) -> int:
+    """Get the current version counter for a cache namespace."""
+    version = client.get(f"{namespace}:version")
+    return int(version) if version else 0
+
+
+def cached_query(
+    namespace: str,
+    params: Iterable[str] = (),
+    ttl: Optional[int] = None,
+    key_fn: Optional[Callable[[], str]] = None
+):
+    """
+    Cache the rendered JSON body of a successful GET endpoint in Redis.
+
+    Cache keys have the form ``{namespace}:v{counter}:{hash}`` where the hash
+    is a blake2b digest of the request parameters, so bumping the namespace
+    counter with :func:`invalidate` drops every cached page at once. Query
+    parameters not listed in ``params`` are left out of the key, so unknown
+    parameters such as cache-busters share the same cached page.
+
+    Args:
+        namespace: Cache namespace (e.g. 'movies')
+        params: Query parameters that affect the response
+        ttl: Time-to-live in seconds (default: CACHE_TTL from config)
+        key_fn: Callable returning the string to hash (overrides params)
+
+    Example:
+        @movies_bp.route('', methods=['GET'])
+        @cached_query('movies', params=('page', 'page_size', 'genre'))
+        def get_movies():
+            ...
+    """
+    params = tuple(params)
+    key_fn = key_fn or (lambda: _query_key(params))
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            client = _get_client()
+            if client is None:
+                return view(*args, **kwargs)
+
+            digest = hashlib.blake2b(key_fn().encode('utf-8'), digest_size=16).hexdigest()
+
+            try:
+                version = _namespace_version(client, namespace)
+                key = f"{namespace}:v{version}:{digest}"
+                body = client.get(key)
+            except redis.RedisError:
+                return view(*args, **kwargs)
+
+            if body is not None:
+                return Response(body, status=200, mimetype='application/json')
+
+            response = make_response(view(*args, **kwargs))
+
+            if response.status_code == 200 and not response.is_streamed:
+                try:
+                    client.setex(
+                        key,
+                        ttl or current_app.config.get('CACHE_TTL', 60),
+                        response.get_data()
+                    )
+                except redis.RedisError:
+                    pass
+
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(*namespaces: str) -> None:
+    """
+    Invalidate cached queries by bumping namespace version counters.
+
+    Args:
+        namespaces: Cache namespaces to invalidate
+    """
+    client = _get_client()
+    if client is None:
+        return
+
+    try:
+        for namespace in namespaces:
+            client.incr(f"{namespace}:version")
+    except redis.RedisError:
+        pass
+
+
+def invalidates(*namespaces: str):
+    """
+    Invalidate cache namespaces after a successful write endpoint.
+
+    Args:
+        namespaces: Cache namespaces affected by the write
+
+    Example:
+        @movies_bp.route('', methods=['POST'])
+        @invalidates('movies', 'actors', 'directors', 'genres')
+        def create_movie():
+            ...
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = make_response(view(*args, **kwargs))
+
+            if response.status_code < 300:
+                invalidate(*namespaces)
+
+            return response
+
+        return wrapper
+
+    return decorator
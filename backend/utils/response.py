@@ -2,8 +2,84 @@
 Utility functions for creating standardized API responses.
 Ensures consistent response format across all endpoints.
 """
-from typing import Any, Optional, Dict
-from flask import jsonify
+from typing import Any, Optional, Dict, Iterable
+import orjson
+from flask import Response, current_app, stream_with_context
+from pydantic import ValidationError
+
+__all__ = [
+    'success_response',
+    'error_response',
+    'paginated_response',
+    'cursor_paginated_response',
+    'stream_paginated_response',
+    'created_response',
+    'no_content_response',
+    'not_found_response',
+    'validation_error_response',
+    'unauthorized_response',
+    'forbidden_response',
+    'server_error_response',
+]
+
+
+def _json_response(payload: Any, status_code: int) -> Response:
+    """
+    Serialize a payload with orjson into a JSON response.
+    
+    Args:
+        payload: JSON-serializable response body
+        status_code: HTTP status code
+        
+    Returns:
+        Response: JSON response
+    """
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+        status=status_code,
+        mimetype='application/json'
+    )
+
+
+def _emit_success(data: Any, message: Optional[str], status_code: int) -> Response:
+    """Serialize a success envelope without pagination metadata."""
+    if message:
+        return _json_response(
+            {"success": True, "data": data, "message": message},
+            status_code
+        )
+    return _json_response({"success": True, "data": data}, status_code)
+
+
+def _emit_success_with_meta(
+    data: Any,
+    message: Optional[str],
+    meta: Dict,
+    status_code: int
+) -> Response:
+    """Serialize a success envelope with metadata."""
+    if message:
+        return _json_response(
+            {"success": True, "data": data, "message": message, "meta": meta},
+            status_code
+        )
+    return _json_response({"success": True, "data": data, "meta": meta}, status_code)
+
+
+def _emit_error(message: str, status_code: int) -> Response:
+    """Serialize an error envelope."""
+    return _json_response(
+        {"success": False, "error": message, "status": status_code},
+        status_code
+    )
+
+
+def _emit_error_with_fields(message: str, status_code: int, errors: Dict) -> Response:
+    """Serialize an error envelope with per-field error details."""
+    return _json_response(
+        {"success": False, "error": message, "status": status_code, "errors": errors},
+        status_code
+    )
 
 
 def success_response(
@@ -31,18 +107,10 @@ def success_response(
             meta={"total": 100, "page": 1}
         )
     """
-    response = {
-        "success": True,
-        "data": data
-    }
-    
-    if message:
-        response["message"] = message
-    
     if meta:
-        response["meta"] = meta
+        return _emit_success_with_meta(data, message, meta, status_code), status_code
     
-    return jsonify(response), status_code
+    return _emit_success(data, message, status_code), status_code
 
 
 def error_response(
@@ -68,16 +136,10 @@ def error_response(
             errors={"title": "Title is required"}
         )
     """
-    response = {
-        "success": False,
-        "error": message,
-        "status": status_code
-    }
-    
     if errors:
-        response["errors"] = errors
+        return _emit_error_with_fields(message, status_code, errors), status_code
     
-    return jsonify(response), status_code
+    return _emit_error(message, status_code), status_code
 
 
 def paginated_response(
@@ -108,9 +170,119 @@ def paginated_response(
             total_items=150
         )
     """
-    total_pages = (total_items + page_size - 1) // page_size
+    meta = _pagination_meta(page, page_size, total_items)
+    
+    return _emit_success_with_meta(data, message, meta, 200), 200
+
+
+def cursor_paginated_response(
+    data: list,
+    page_size: int,
+    total_items: int,
+    next_cursor: Optional[Dict] = None
+) -> tuple:
+    """
+    Create a keyset (cursor) paginated response.
     
+    Page numbers have no meaning when seeking by cursor, so the metadata
+    carries the cursor for the next page instead of page/total_pages/has_prev.
+    
+    Args:
+        data: List of items for current page
+        page_size: Number of items per page
+        total_items: Total number of items across all pages
+        next_cursor: Query parameters for the next page, or None on the last page
+        
+    Returns:
+        tuple: (JSON response, status code)
+        
+    Example:
+        return cursor_paginated_response(
+            data=movies,
+            page_size=20,
+            total_items=150,
+            next_cursor={"after_year": 2010, "after_id": 42}
+        )
+    """
     meta = {
+        "page_size": page_size,
+        "total_items": total_items,
+        "has_next": next_cursor is not None,
+        "next_cursor": next_cursor
+    }
+    
+    return _emit_success_with_meta(data, None, meta, 200), 200
+
+
+# Marks an empty iterable in stream_paginated_response
+_NO_ITEMS = object()
+
+
+def stream_paginated_response(
+    data: Iterable,
+    page: int,
+    page_size: int,
+    total_items: int
+) -> Response:
+    """
+    Create a paginated response that streams items as they are serialized.
+    
+    Produces the same envelope as paginated_response, but never holds the
+    full page of items in memory. The first item is pulled before the
+    response is returned, so query and serialization errors on it still
+    propagate to the caller. An error later in the stream cannot change
+    the status any more; the envelope is then closed with "success": false
+    and an error message instead of leaving truncated JSON.
+    
+    Resources the iterable depends on (e.g. the database session) must be
+    released with ``response.call_on_close``, which also runs when the body
+    is never iterated, such as for HEAD requests.
+    
+    Args:
+        data: Iterable of serializable items for current page (may be a generator)
+        page: Current page number (1-indexed)
+        page_size: Number of items per page
+        total_items: Total number of items across all pages
+        
+    Returns:
+        Response: Streaming JSON response
+    """
+    meta = _pagination_meta(page, page_size, total_items)
+    items = iter(data)
+    first = next(items, _NO_ITEMS)
+    
+    def generate():
+        yield b'{"meta":' + orjson.dumps(meta) + b',"data":['
+        try:
+            if first is not _NO_ITEMS:
+                yield orjson.dumps(first, option=orjson.OPT_NON_STR_KEYS)
+                for item in items:
+                    yield b',' + orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+        except Exception:
+            current_app.logger.exception("Error while streaming paginated response")
+            yield b'],"success":false,"error":"Error streaming results","status":500}'
+            return
+        yield b'],"success":true}'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def _pagination_meta(page: int, page_size: int, total_items: int) -> Dict:
+    """
+    Build pagination metadata.
+    
+    Args:
+        page: Current page number (1-indexed)
+        page_size: Number of items per page
+        total_items: Total number of items across all pages
+        
+    Returns:
+        dict: Pagination metadata
+    """
+    quotient, remainder = divmod(total_items, page_size)
+    total_pages = quotient + 1 if remainder else quotient
+    
+    return {
         "page": page,
         "page_size": page_size,
         "total_items": total_items,
@@ -118,8 +290,6 @@ def paginated_response(
         "has_next": page < total_pages,
         "has_prev": page > 1
     }
-    
-    return success_response(data=data, message=message, meta=meta)
 
 
 def created_response(
@@ -139,14 +309,18 @@ def created_response(
     return success_response(data=data, message=message, status_code=201)
 
 
-def no_content_response() -> tuple:
+def no_content_response() -> Response:
     """
     Create a 204 No Content response.
     
+    A new Response is built on every call rather than sharing one instance:
+    after_request handlers such as Flask-CORS add per-request headers to
+    the response object they are given.
+    
     Returns:
-        tuple: (Empty response, status code)
+        Response: Empty 204 response
     """
-    return '', 204
+    return Response(status=204)
 
 
 def not_found_response(message: str = "Resource not found") -> tuple:
@@ -162,45 +336,74 @@ def not_found_response(message: str = "Resource not found") -> tuple:
     return error_response(message=message, status_code=404)
 
 
+def _format_pydantic_list(errors: list) -> Dict:
+    """
+    Convert Pydantic validation errors to a {field: message} mapping.
+    
+    Args:
+        errors: Errors as returned by ValidationError.errors()
+        
+    Returns:
+        dict: Error message per field
+    """
+    try:
+        return {
+            (str(error['loc'][-1]) if error.get('loc') else 'unknown'):
+                str(error.get('msg', 'Validation error'))
+            for error in errors
+        }
+    except Exception:
+        # Fallback for any errors during formatting
+        return {'unknown': 'Validation error occurred'}
+
+
+def _format_validation_error(exc: ValidationError) -> Dict:
+    """
+    Convert a Pydantic ValidationError to a {field: message} mapping.
+    
+    Only loc and msg are used, so Pydantic is told not to build the
+    url, ctx and input entries of each error.
+    
+    Args:
+        exc: Raised validation error
+        
+    Returns:
+        dict: Error message per field
+    """
+    return _format_pydantic_list(
+        exc.errors(include_url=False, include_context=False, include_input=False)
+    )
+
+
+def _passthrough(errors: Any) -> Any:
+    """Return already-formatted errors unchanged."""
+    return errors
+
+
+# Error formatter by type of the errors argument
+_FORMATTERS = {
+    ValidationError: _format_validation_error,
+    list: _format_pydantic_list,
+    dict: _passthrough,
+}
+
+
 def validation_error_response(errors) -> tuple:
     """
     Create a 422 Unprocessable Entity response for validation errors.
     
     Args:
-        errors: Pydantic validation errors (list) or dictionary of errors
+        errors: Pydantic ValidationError, its errors() list, or dictionary of errors
         
     Returns:
         tuple: (JSON response, status code)
     """
-    # Convert Pydantic errors to serializable format
-    if isinstance(errors, list):
-        formatted_errors = {}
-        for error in errors:
-            try:
-                # Get field name from location tuple
-                loc = error.get('loc', ('unknown',))
-                field = str(loc[-1]) if loc else 'unknown'
-                
-                # Get error message and convert any non-serializable objects
-                msg = error.get('msg', 'Validation error')
-                if hasattr(msg, '__str__'):
-                    msg = str(msg)
-                
-                # Get error type for context
-                error_type = error.get('type', 'validation_error')
-                
-                # Combine message and type for clarity
-                formatted_errors[field] = f"{msg}"
-            except Exception:
-                # Fallback for any errors during formatting
-                formatted_errors['unknown'] = 'Validation error occurred'
-    else:
-        formatted_errors = errors
+    formatter = _FORMATTERS.get(type(errors), _passthrough)
     
     return error_response(
         message="Validation failed",
         status_code=422,
-        errors=formatted_errors
+        errors=formatter(errors)
     )
 
 
@@ -2,9 +2,14 @@
 Custom validation utilities for the application.
 Contains reusable validation functions for common use cases.
 """
+import time
 from datetime import datetime
 from typing import Optional
 
+# Current year and the monotonic time it should be re-read at
+_YEAR_CACHE = [0, 0.0]
+_YEAR_CACHE_TTL = 3600
+
 
 def validate_year(year: int) -> bool:
     """
@@ -17,10 +22,15 @@ def validate_year(year: int) -> bool:
         bool: True if valid, False otherwise
         
     Note:
-        Movies started around 1888, and we allow up to 5 years in the future
+        Movies started around 1888, and we allow up to 5 years in the future.
+        The current year is cached for up to an hour.
     """
-    current_year = datetime.now().year
-    return 1888 <= year <= current_year + 5
+    now = time.monotonic()
+    if now >= _YEAR_CACHE[1]:
+        _YEAR_CACHE[0] = datetime.now().year
+        _YEAR_CACHE[1] = now + _YEAR_CACHE_TTL
+    
+    return 1888 <= year <= _YEAR_CACHE[0] + 5
 
 
 def validate_rating(rating: float) -> bool:
@@ -76,8 +86,14 @@ def sanitize_search_query(query: Optional[str]) -> Optional[str]:
     if not query:
         return None
     
+    # Already clean: return the original string without copying
+    if len(query) <= 200 and not (query[0].isspace() or query[-1].isspace()):
+        return query
+    
     # Strip whitespace and limit length
-    sanitized = query.strip()[:200]
+    sanitized = query.strip()
+    if len(sanitized) > 200:
+        sanitized = sanitized[:200]
     
     return sanitized if sanitized else None
 
@@ -92,9 +108,12 @@ def validate_id(id_value: any) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
+    # Flask's int converter already hands over an int; skip the conversion
+    if type(id_value) is int:
+        return id_value > 0
+    
     try:
-        id_int = int(id_value)
-        return id_int > 0
+        return int(id_value) > 0
     except (ValueError, TypeError):
         return False
 
@@ -112,5 +131,8 @@ def normalize_string(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
     
-    normalized = value.strip()
-    return normalized if normalized else None
\ No newline at end of file
+    # Already trimmed: return the original string without copying
+    if not (value[0].isspace() or value[-1].isspace()):
+        return value
+    
+    return value.strip() or None
\ No newline at end of file